@@ -1,8 +1,158 @@
 import numpy as np
 
+def _vetor_dual(v, p):
+    """
+    Retorna o vetor dual de v na norma-p: tem norma-q unitária (1/p + 1/q = 1)
+    e produto escalar com v igual a ||v||_p.
+    """
+    if p == 1:
+        return np.sign(v)
+    modulo = np.abs(v)
+    escala = modulo.max()
+    if escala == 0:
+        return np.zeros_like(v)
+    modulo = modulo / escala  # evita overflow/underflow nas potências
+    return np.sign(v) * modulo ** (p - 1) / np.sum(modulo ** p) ** ((p - 1) / p)
+
+
+def _norma_p(v, p, axis=None):
+    """
+    Norma-p de v (ou de cada fatia ao longo de 'axis'), escalada por max|v|,
+    como em _vetor_dual, para não transbordar nas potências.
+    """
+    modulo = np.abs(v)
+    escala = modulo.max(axis=axis, keepdims=True)
+    escala[escala == 0] = 1.0
+    norma = escala * np.sum((modulo / escala) ** p, axis=axis, keepdims=True) ** (1 / p)
+    return norma.reshape(-1) if axis is not None else norma.item()
+
+def norma_p_induzida(matriz, p, tol=1e-10, max_iter=100):
+    """
+    Estima a norma-p induzida de uma matriz n x n de forma determinística,
+    pelo método da potência para a norma-p (Boyd / Higham).
+
+    A iteração parte de três vetores, cada um ótimo num caso limite: uma
+    aproximação do vetor singular à direita dominante (p = 2, por alguns passos
+    do método da potência em AᵗA), a coluna de maior norma-p (p -> 1) e o dual
+    da linha de maior norma-q (p -> infinito). Fica com a maior das três
+    estimativas.
+
+    O método converge para um máximo local de ||A x||_p / ||x||_p: o resultado
+    é uma cota inferior da norma, em geral exata ou muito próxima, mas sem
+    garantia (pode ficar alguns porcento abaixo do valor exato).
+    Para p = 1, 2 e infinito o valor é exato e nenhuma iteração é feita; para
+    matrizes 2x2, norma_p_matriz_2por2 calcula o máximo global.
+
+    Retorna a tupla (norma, iteracoes), onde 'iteracoes' é o total de
+    iterações do método da potência usadas.
+    """
+
+    matriz = np.asarray(matriz, dtype=float)
+    if matriz.ndim != 2:
+        raise ValueError("A matriz deve ser bidimensional.")
+    if not p >= 1:
+        raise ValueError("A norma-p induzida exige p >= 1.")
+
+    # Casos exatos
+    if p == 1:
+        return np.abs(matriz).sum(axis=0).max(), 0
+    if p == float('inf'):
+        return np.abs(matriz).sum(axis=1).max(), 0
+    if p == 2:
+        return np.linalg.norm(matriz, 2), 0
+
+    q = p / (p - 1)
+
+    # Vetor singular dominante aproximado: parte da linha de maior norma-2
+    # (Aᵗ e_i) e aplica alguns passos do método da potência em AᵗA, O(n²) cada,
+    # em vez de uma SVD completa O(n³)
+    v_singular = matriz[np.argmax(_norma_p(matriz, 2, axis=1))]
+    for _ in range(5):
+        # Reescala antes de cada produto: AᵗA pode transbordar mesmo com A representável
+        for operador in (matriz, matriz.T):
+            escala = np.abs(v_singular).max()
+            if escala == 0:
+                break
+            v_singular = operador @ (v_singular / escala)
+
+    # Vetores iniciais, todos com norma-p unitária
+    normas_colunas = _norma_p(matriz, p, axis=0)
+    coluna = np.zeros(matriz.shape[1])
+    coluna[np.argmax(normas_colunas)] = 1.0
+    normas_linhas = _norma_p(matriz, q, axis=1)
+    linha = _vetor_dual(matriz[np.argmax(normas_linhas)], q)
+    iniciais = [coluna, linha]
+    if np.any(v_singular):
+        iniciais.insert(0, v_singular / _norma_p(v_singular, p))
+
+    maior_valor = 0.0
+    iteracoes = 0
+    for x in iniciais:
+        gamma = 0.0
+        for _ in range(max_iter):
+            iteracoes += 1
+            y = matriz @ x
+            gamma_novo = _norma_p(y, p)
+            z = matriz.T @ _vetor_dual(y, p)
+
+            # Para quando a estimativa estabiliza ou x satisfaz a condição
+            # de otimalidade local ||z||_q <= zᵗx
+            if (gamma_novo - gamma <= tol * gamma_novo
+                    or _norma_p(z, q) <= (z @ x) * (1 + tol)):
+                gamma = max(gamma, gamma_novo)
+                break
+            gamma = gamma_novo
+            x = _vetor_dual(z, q)
+
+        if gamma > maior_valor:
+            maior_valor = gamma
+
+    return maior_valor, iteracoes
+
+
+def _norma_p_circulo(matriz, p, pontos=512, iteracoes=60):
+    """
+    Norma-p induzida de uma matriz 2x2 como máximo global, em θ ∈ [0, π), de
+    f(θ) = ||A u(θ)||_p / ||u(θ)||_p com u(θ) = (cos θ, sen θ), que percorre
+    todas as direções do círculo unitário da norma-p (f(θ + π) = f(θ)).
+
+    f é avaliada em 'pontos' ângulos igualmente espaçados e cada máximo local da
+    amostra é refinado por seção áurea no intervalo entre seus vizinhos, todos
+    ao mesmo tempo; o maior resultado é o máximo global.
+    """
+    escala = np.abs(matriz).max()
+    if escala == 0:
+        return 0.0
+    A = matriz / escala
+
+    def f(theta):
+        u = np.stack([np.cos(theta), np.sin(theta)])
+        return _norma_p(A @ u, p, axis=0) / _norma_p(u, p, axis=0)
+
+    passo = np.pi / pontos
+    angulos = np.arange(pontos) * passo
+    valores = f(angulos)
+    maximos = (valores >= np.roll(valores, 1)) & (valores >= np.roll(valores, -1))
+
+    # Seção áurea em [θ_k - passo, θ_k + passo] para cada máximo local θ_k
+    razao = (np.sqrt(5) - 1) / 2
+    esquerda = angulos[maximos] - passo
+    direita = angulos[maximos] + passo
+    for _ in range(iteracoes):
+        t1 = direita - razao * (direita - esquerda)
+        t2 = esquerda + razao * (direita - esquerda)
+        sobe = f(t1) < f(t2)
+        esquerda = np.where(sobe, t1, esquerda)
+        direita = np.where(sobe, direita, t2)
+
+    return escala * max(valores.max(), f((esquerda + direita) / 2).max())
+
 def norma_p_matriz_2por2(matriz, p):
     """
-    Estima a norma-p induzida de uma matriz 2x2.
+    Calcula a norma-p induzida de uma matriz 2x2.
+
+    Para p = 1, 2 e infinito usa fórmulas fechadas; para os demais valores,
+    o máximo global sobre o círculo unitário da norma-p (_norma_p_circulo).
     """
 
     # Verificação de tipo e forma
@@ -41,25 +191,73 @@ def norma_p_matriz_2por2(matriz, p):
             lambda_max = 0.0
         return lambda_max ** 0.5
 
-    # Para outros valores de p ≥ 1: estimativa via amostragem
-    def norma_p_vetor(v, p):
-        return (abs(v[0])**p + abs(v[1])**p) ** (1/p)
+    # Para outros valores de p ≥ 1: busca global no círculo unitário da norma-p
+    return _norma_p_circulo(np.asarray(matriz, dtype=float), p)
+
 
-    maior_valor = 0
-    N = 20000
-    for _ in range(N):
-        x = [np.random.randn(), np.random.randn()]
-        norma_x = norma_p_vetor(x, p)
-        if norma_x < 1e-9:
-            continue
+def norma_p_matriz_2por2_lote(matrizes, p, out=None, auxiliar=None):
+    """
+    Versão em lote de norma_p_matriz_2por2: recebe um array (N, 2, 2) e
+    retorna um array (N,) com a norma-p induzida de cada matriz.
+
+    Os casos p = 1, p = infinito e p = 2 são calculados com operações
+    vetorizadas sobre o lote inteiro, escrevendo apenas em 'out' (N,) e em
+    'auxiliar' (2, N). Passando os dois buffers já alocados, chamadas
+    repetidas não alocam nenhum array do tamanho do lote.
+    """
 
-        # Produto Ax manual
-        Ax = [matriz[0,0]*x[0] + matriz[0,1]*x[1],
-              matriz[1,0]*x[0] + matriz[1,1]*x[1]]
+    # Verificação de tipo e forma (uma única vez para o lote inteiro)
+    matrizes = np.asarray(matrizes, dtype=float)
+    if matrizes.ndim != 3 or matrizes.shape[1:] != (2, 2):
+        raise ValueError("As matrizes devem formar um array de forma (N, 2, 2).")
 
-        norma_Ax = norma_p_vetor(Ax, p)
-        atual = norma_Ax / norma_x
-        if atual > maior_valor:
-            maior_valor = atual
+    N = matrizes.shape[0]
+    if out is None:
+        out = np.empty(N)
+    elif out.shape != (N,):
+        raise ValueError(f"O buffer 'out' deve ter forma ({N},).")
+
+    a, b = matrizes[:, 0, 0], matrizes[:, 0, 1]
+    c, d = matrizes[:, 1, 0], matrizes[:, 1, 1]
+
+    if p in (1, 2, float('inf')):
+        if auxiliar is None:
+            auxiliar = np.empty((2, N))
+        elif auxiliar.shape != (2, N):
+            raise ValueError(f"O buffer 'auxiliar' deve ter forma (2, {N}).")
+
+    # Casos exatos para p = 1 (maior soma de coluna) e p = infinito (maior soma de linha).
+    # Como |x| + |y| = max(|x + y|, |x - y|), a norma é o máximo de quatro módulos,
+    # acumulado em 'out'.
+    if p == 1 or p == float('inf'):
+        (x0, y0), (x1, y1) = ((a, c), (b, d)) if p == 1 else ((a, b), (c, d))
+        termo = auxiliar[0]
+        np.add(x0, y0, out=out)
+        np.abs(out, out=out)
+        for x, y, operacao in ((x0, y0, np.subtract), (x1, y1, np.add), (x1, y1, np.subtract)):
+            operacao(x, y, out=termo)
+            np.abs(termo, out=termo)
+            np.maximum(out, termo, out=out)
+        return out
+
+    # Caso especial: p = 2. Para A = [[a, b], [c, d]], σ₁ = (|z₁| + |z₂|) / 2 com
+    # z₁ = (a + d) + i(c - b) e z₂ = (a - d) + i(c + b). Os módulos vêm de hypot,
+    # sem elevar nada ao quadrado: não há overflow para entradas grandes nem o
+    # cancelamento de tr² - 4 det da fórmula fechada da versão escalar.
+    if p == 2:
+        x, y = auxiliar
+        np.add(a, d, out=x)
+        np.subtract(c, b, out=y)
+        np.hypot(x, y, out=out)         # |z₁|
+        np.subtract(a, d, out=x)
+        np.add(b, c, out=y)
+        np.hypot(x, y, out=x)           # |z₂|
+        out *= 0.5
+        x *= 0.5
+        out += x
+        return out
 
-    return maior_valor
+    # Para outros valores de p ≥ 1: recorre à versão escalar, matriz a matriz
+    for i in range(N):
+        out[i] = norma_p_matriz_2por2(matrizes[i], p)
+    return out
@@ -101,4 +101,124 @@ def volume_vetores(v1_input: list, v2_input: list, v3_input: list) -> float:
     else:
         volume_final = (1.0 / 6.0) * np.sqrt(determinante_gram)
 
-    return volume_final
\ No newline at end of file
+    return volume_final
+
+def volume_simplex_lote(vetores, tamanho_bloco: int = 65536) -> np.ndarray:
+    """
+    Generaliza volume_vetores para lotes: calcula o volume de M k-simplexos,
+    cada um formado por k vetores no espaço n-dimensional e a origem.
+
+    Ao contrário de volume_vetores, esta função não segue a restrição do exercício
+    (apenas numpy.array e numpy.sqrt): ela é vetorizada com numpy.linalg.
+    Em vez de expandir o determinante da Matriz de Gram, usa a fatoração QR
+    de cada matriz (n x k) de vetores, já que sqrt(det(G)) = |det(R)|.
+    Quando k = n, usa diretamente |det| (fatoração LU), que é mais barato.
+    O lote é processado em blocos de 'tamanho_bloco' simplexos para limitar
+    o uso de memória quando M é muito grande.
+
+    Args:
+        vetores (array-like): Array de forma (M, k, n) com os k vetores de cada simplexo.
+        tamanho_bloco (int): Quantidade de simplexos processados por vez.
+
+    Returns:
+        np.ndarray: Array (M,) com os volumes V = (1/k!) * sqrt(det(G)).
+
+    Raises:
+        ValueError: Se a entrada não tiver forma (M, k, n) ou 'tamanho_bloco' não for positivo.
+    """
+    vetores = np.asarray(vetores, dtype=float)
+    if vetores.ndim != 3:
+        raise ValueError("Os vetores devem formar um array de forma (M, k, n).")
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco deve ser positivo.")
+
+    M, k, dimensao_n = vetores.shape
+    volumes = np.zeros(M)
+
+    # Com mais vetores do que dimensões, os vetores são linearmente dependentes
+    # e todos os volumes são nulos.
+    if k > dimensao_n or M == 0:
+        return volumes
+
+    fatorial_k = np.prod(np.arange(1, k + 1), dtype=float)
+
+    for inicio in range(0, M, tamanho_bloco):
+        bloco = vetores[inicio:inicio + tamanho_bloco]
+        if k == dimensao_n:
+            volumes_bloco = np.abs(np.linalg.det(bloco))
+        else:
+            # As colunas de cada matriz (n x k) são os vetores do simplexo.
+            R = np.linalg.qr(np.swapaxes(bloco, 1, 2), mode='r')
+            volumes_bloco = np.abs(np.diagonal(R, axis1=1, axis2=2)).prod(axis=1)
+        np.divide(volumes_bloco, fatorial_k, out=volumes[inicio:inicio + len(bloco)])
+
+    return volumes
+
+
+def _abrir_array(origem):
+    """Abre um caminho para arquivo .npy como memmap somente leitura; arrays são devolvidos como estão."""
+    if isinstance(origem, (str, bytes)) or hasattr(origem, "__fspath__"):
+        return np.load(origem, mmap_mode='r')
+    return np.asarray(origem)
+
+
+def volume_malha(vertices, tetraedros, tamanho_bloco: int = 1_000_000, arquivo_saida=None):
+    """
+    Calcula o volume de cada tetraedro de uma malha indexada e o volume total.
+
+    A malha é dada por um array de vértices (V, n) e um array de conectividade
+    (M, 4) com os índices dos vértices de cada célula. Ambos podem ser arrays
+    em memória ou caminhos para arquivos .npy, que são abertos como memmap.
+    As células são processadas em blocos de 'tamanho_bloco': os vértices de
+    cada bloco são reunidos por índice, os vetores diferença são formados e os
+    volumes são calculados por volume_simplex_lote. Assim apenas um bloco de
+    células fica em memória de cada vez.
+
+    Args:
+        vertices (array-like ou caminho): Coordenadas dos vértices, forma (V, n) com n >= 3.
+        tetraedros (array-like ou caminho): Índices dos vértices de cada célula, forma (M, 4).
+        tamanho_bloco (int): Quantidade de células processadas por vez.
+        arquivo_saida (caminho, opcional): Se fornecido, os volumes por célula são
+            gravados neste arquivo .npy (memmap) em vez de ficarem em memória.
+
+    Returns:
+        tuple: (volumes, volume_total), onde 'volumes' é um array (M,) (ou o memmap
+        gravado em 'arquivo_saida') e 'volume_total' é a soma dos volumes.
+
+    Raises:
+        ValueError: Se as formas dos arrays forem inválidas ou 'tamanho_bloco' não for positivo.
+    """
+    vertices = _abrir_array(vertices)
+    tetraedros = _abrir_array(tetraedros)
+
+    if vertices.ndim != 2 or vertices.shape[1] < 3:
+        raise ValueError("Os vértices devem formar um array de forma (V, n) com n >= 3.")
+    if tetraedros.ndim != 2 or tetraedros.shape[1] != 4:
+        raise ValueError("A conectividade deve ser um array de forma (M, 4).")
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco deve ser positivo.")
+
+    M = tetraedros.shape[0]
+    if arquivo_saida is None:
+        volumes = np.empty(M)
+    else:
+        volumes = np.lib.format.open_memmap(arquivo_saida, mode='w+', dtype=float, shape=(M,))
+
+    volume_total = 0.0
+    for inicio in range(0, M, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, M)
+
+        # Reúne os vértices do bloco: forma (c, 4, n)
+        indices = np.asarray(tetraedros[inicio:fim])
+        pontos = np.asarray(vertices[indices.ravel()], dtype=float).reshape(fim - inicio, 4, -1)
+
+        # Vetores a partir do primeiro vértice de cada célula: forma (c, 3, n)
+        diferencas = pontos[:, 1:, :] - pontos[:, :1, :]
+
+        volumes[inicio:fim] = volume_simplex_lote(diferencas, tamanho_bloco=fim - inicio)
+        volume_total += float(volumes[inicio:fim].sum())
+
+    if arquivo_saida is not None:
+        volumes.flush()
+
+    return volumes, volume_total
@@ -2,25 +2,155 @@
 from numpy import array, zeros, abs
 from numpy.linalg import eig
 
-def aproximacao_truncada(matriz_original, num_autovalores_manter):
+# Usadas fora das restrições do exercício: modo iterativo e TruncamentoAutovalores
+from numpy import concatenate, conj, hypot, iscomplexobj, sqrt
+from numpy.linalg import eigh, inv, solve
+from scipy.linalg.lapack import dgeev
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.linalg import eigs, eigsh
+
+def _eh_simetrica(matriz_numpy, tol=1e-12):
+    """Verifica se a matriz é simétrica, a menos de uma tolerância relativa."""
+    escala = abs(matriz_numpy).max() if matriz_numpy.size else 0.0
+    return bool(abs(matriz_numpy - matriz_numpy.T).max(initial=0.0) <= tol * escala)
+
+
+def _aproximacao_simetrica(matriz_numpy, num_autovalores_manter, metodo):
+    """
+    Caminho para matrizes simétricas: autovalores reais e P ortogonal (P⁻¹ = Pᵀ),
+    logo A' = P_m D_m P_mᵀ, toda em aritmética real.
+    """
+    n = matriz_numpy.shape[0]
+    m = num_autovalores_manter
+    if m == 0:
+        return zeros((n, n))
+
+    if metodo == "iterativo" and m < n:
+        autovalores, autovetores = eigsh(matriz_numpy, k=m, which='LM')
+    else:
+        autovalores, autovetores = eigh(matriz_numpy)
+        indices_a_preservar = abs(autovalores).argsort()[n - m:]
+        autovalores = autovalores[indices_a_preservar]
+        autovetores = autovetores[:, indices_a_preservar]
+
+    return (autovetores * autovalores) @ autovetores.T
+
+
+def _aproximacao_real(matriz_numpy, num_autovalores_manter):
+    """
+    Caminho para matrizes reais gerais, em forma real bloco-diagonal.
+
+    Cada par conjugado λ = a ± ib com autovetores x ± iy vira o bloco real
+    [[a, b], [-b, a]] na base {x, y}, de modo que P, D' e a solução que faz o
+    papel de P⁻¹ são todas reais. Se o corte em m separa um par, o bloco entra
+    com peso 1/2, que é exatamente a parte real do termo complexo isolado.
+
+    Os autopares vêm do dgeev do LAPACK, que já devolve P nessa base real
+    (colunas x, y consecutivas), sem criar a matriz complexa n x n de eig.
+    """
+    n = matriz_numpy.shape[0]
+    m = num_autovalores_manter
+    partes_reais, partes_imaginarias, _, matriz_real, info = dgeev(matriz_numpy, compute_vl=0)
+    if info > 0:
+        raise ValueError("O cálculo dos autovalores (dgeev) não convergiu.")
+
+    pesos = zeros(n)
+    pesos[hypot(partes_reais, partes_imaginarias).argsort()[n - m:]] = 1.0
+    produto_pd = matriz_real * (partes_reais * pesos)
+
+    # Cada par conjugado ocupa as posições consecutivas (j, j+1), com a parte
+    # imaginária positiva primeiro: colunas x = Re(p_j) e y = Im(p_j)
+    pares = (partes_imaginarias > 0).nonzero()[0]
+    if pares.size:
+        a, b = partes_reais[pares], partes_imaginarias[pares]
+        peso_par = (pesos[pares] + pesos[pares + 1]) / 2
+        x, y = matriz_real[:, pares], matriz_real[:, pares + 1]
+        produto_pd[:, pares] = (x * a - y * b) * peso_par
+        produto_pd[:, pares + 1] = (x * b + y * a) * peso_par
+
+    # A' = (P D') P⁻¹, resolvendo Pᵀ A'ᵀ = (P D')ᵀ em vez de inverter P
+    return solve(matriz_real.T, produto_pd.T).T
+
+def _aproximacao_iterativa(matriz_numpy, num_autovalores_manter):
+    """
+    Constrói A' a partir apenas dos 'num_autovalores_manter' autopares dominantes,
+    calculados iterativamente (Arnoldi implicitamente reiniciado, via ARPACK).
+
+    Os autovetores à esquerda são os autovetores à direita de Aᵀ, de modo que
+    A' = Σ λᵢ pᵢ wᵢᵀ / (wᵢᵀ pᵢ) é montada sem formar P⁻¹ nem a decomposição completa.
+    """
+    n = matriz_numpy.shape[0]
+    m = num_autovalores_manter
+    # São pedidos autopares a mais, em A e em Aᵀ: com autovalores de módulos quase
+    # iguais, o ARPACK pode devolver um conjunto diferente dos m maiores ou o m-ésimo
+    # maior pode sair diferente nas duas execuções.
+    k_extra = min(n - 2, 2 * m + 10)
+    autovalores, autovetores_direita = eigs(matriz_numpy, k=k_extra, which='LM')
+    maiores = (-abs(autovalores)).argsort(kind="stable")[:m]
+    autovalores, autovetores_direita = autovalores[maiores], autovetores_direita[:, maiores]
+
+    k_esquerda = k_extra
+    autovalores_esquerda, autovetores_esquerda = eigs(matriz_numpy.T, k=k_esquerda, which='LM')
+
+    # Como A é real, se w é autovetor à esquerda de λ, w̄ é de λ̄: os conjugados
+    # completam os pares que o ARPACK separou (m perto de n, sem folga em k_esquerda)
+    autovalores_esquerda = concatenate([autovalores_esquerda, conj(autovalores_esquerda)])
+    autovetores_esquerda = concatenate([autovetores_esquerda, conj(autovetores_esquerda)], axis=1)
+
+    # Associa cada autovalor de A ao autovalor de Aᵀ mais próximo (sem repetição)
+    distancias = abs(autovalores[:, None] - autovalores_esquerda[None, :])
+    linhas, pares = linear_sum_assignment(distancias)
+    if distancias[linhas, pares].max() > 1e-8 * max(abs(autovalores).max(), 1.0):
+        # Os dois espectros calculados não coincidem: usa a decomposição completa
+        return _aproximacao_real(matriz_numpy, m)
+    autovetores_esquerda = autovetores_esquerda[:, pares]
+
+    # Normalização biortogonal: wᵢᵀ pᵢ = 1
+    escalas = (autovetores_esquerda * autovetores_direita).sum(axis=0)
+    if (abs(escalas) < 1e-14).any():
+        raise ValueError("Autovetores à esquerda e à direita quase ortogonais: "
+                         "autovalor defectivo ou mal condicionado.")
+
+    # A' = P_m · diag(λ / s) · W_mᵀ, com custo O(n² m)
+    matriz_aproximada = (autovetores_direita * (autovalores / escalas)) @ autovetores_esquerda.T
+    return matriz_aproximada.real
+
+
+def aproximacao_truncada(matriz_original, num_autovalores_manter, metodo="completo",
+                         detectar_estrutura=True):
     """
         Cria uma matriz A' que representa uma versão aproximada da matriz de entrada,
         focando nos 'num_autovalores_manter' autovalores de maior módulo.
 
-        Esta versão da função executa as operações de produto e inversão de matrizes
-        sem o auxílio direto de bibliotecas externas, atendendo às restrições do problema.
+        Por padrão (detectar_estrutura=True), a aproximação é calculada em aritmética
+        real com rotinas do LAPACK: eigh para matrizes simétricas e dgeev (forma real
+        bloco-diagonal) com solve no lugar de P⁻¹ para as demais. O caminho restrito
+        do exercício, com eig e produto e inversão de matrizes implementados
+        manualmente, é usado com detectar_estrutura=False.
 
         Argumentos:
             matriz_original (list ou numpy.array): A matriz quadrada inicial (de dimensão n x n).
             num_autovalores_manter (int): A quantidade de autovalores com maior valor absoluto
                                         que serão utilizados na construção da aproximação.
+            metodo (str): "completo" (padrão) usa a decomposição completa (dgeev/eigh,
+                          ou eig e as operações manuais com detectar_estrutura=False).
+                          "iterativo" calcula apenas os autopares dominantes com Arnoldi
+                          e monta A' a partir dos autovetores à direita e à esquerda, sem
+                          inverter P; indicado para n grande e m pequeno. Para m >= n - 1
+                          (fora do alcance do ARPACK) usa a decomposição completa.
+            detectar_estrutura (bool): Se True (padrão), matrizes simétricas usam um
+                          solver simétrico (P⁻¹ = Pᵀ) e as demais usam a forma real
+                          bloco-diagonal, ambos sem aritmética complexa. Se False,
+                          usa o caminho original do exercício (eig complexo e
+                          operações manuais, atendendo às restrições do problema).
 
         Retorna:
             numpy.array: A matriz aproximada gerada (n x n).
 
         Exceções:
             ValueError: Disparada se a matriz fornecida não for quadrada, se o parâmetro
-                        'num_autovalores_manter' for inválido, ou se a matriz de autovetores for singular.
+                        'num_autovalores_manter' ou 'metodo' for inválido, ou se a matriz de
+                        autovetores for singular.
     """
 
     # =========================================================================
@@ -105,6 +235,22 @@ def aproximacao_truncada(matriz_original, num_autovalores_manter):
                          f"que a dimensão da matriz (n={n}).")
     if num_autovalores_manter < 0:
         raise ValueError("O número de autovalores a manter (m) não pode ser negativo.")
+    if metodo not in ("completo", "iterativo"):
+        raise ValueError(f"Método desconhecido: {metodo!r}. Use 'completo' ou 'iterativo'.")
+
+    # --- Caminhos rápidos em aritmética real ---
+    if detectar_estrutura and _eh_simetrica(matriz_numpy):
+        return _aproximacao_simetrica(matriz_numpy, num_autovalores_manter, metodo)
+    # O ARPACK exige m < n - 1; acima disso o modo iterativo também usa a forma real
+    if detectar_estrutura and (metodo == "completo" or num_autovalores_manter >= n - 1):
+        return _aproximacao_real(matriz_numpy, num_autovalores_manter)
+
+    # --- Modo iterativo: apenas os m autopares dominantes ---
+    # O ARPACK exige m < n - 1; acima disso a decomposição completa é o caminho natural.
+    if metodo == "iterativo" and num_autovalores_manter < n - 1:
+        if num_autovalores_manter == 0:
+            return zeros((n, n))
+        return _aproximacao_iterativa(matriz_numpy, num_autovalores_manter)
 
     # --- Passo 1: Realizar a decomposição de autovalores ---
     autovalores, autovetores = eig(matriz_numpy)
@@ -127,4 +273,88 @@ def aproximacao_truncada(matriz_original, num_autovalores_manter):
     produto_temp = realizar_multiplicacao_matrizes(matriz_autovetores, matriz_diagonal_modificada)
     matriz_aproximada_final = realizar_multiplicacao_matrizes(produto_temp, matriz_inversa_autovetores)
     
-    return matriz_aproximada_final.real # Retorna a parte real, conforme autovalores reais
\ No newline at end of file
+    return matriz_aproximada_final.real # Retorna a parte real, conforme autovalores reais
+
+
+class TruncamentoAutovalores:
+    """
+        Fatora a matriz uma única vez (A = P D P⁻¹) e devolve a aproximação truncada
+        A'(m) para qualquer m, sem repetir a decomposição, a inversão e os produtos.
+
+        Os autovalores são ordenados por módulo decrescente. A'(m) é mantida em um
+        acumulador: passar de A'(m) para A'(m+1) soma um único produto externo
+        λ_m p_m q_mᵀ (p_m coluna de P, q_m linha de P⁻¹); vários passos de uma vez
+        viram um único produto de matrizes.
+
+        Argumentos:
+            matriz_original (list ou numpy.array): A matriz quadrada inicial (n x n).
+
+        Exceções:
+            ValueError: Disparada se a matriz fornecida não for quadrada.
+    """
+
+    def __init__(self, matriz_original):
+        matriz_numpy = array(matriz_original, dtype=float)
+        if matriz_numpy.ndim != 2 or matriz_numpy.shape[0] != matriz_numpy.shape[1]:
+            raise ValueError("A matriz de entrada deve ser quadrada para o cálculo de autovalores.")
+
+        self.n = matriz_numpy.shape[0]
+
+        autovalores, autovetores = eig(matriz_numpy)
+        ordem = (-abs(autovalores)).argsort(kind="stable")
+        self.autovalores = autovalores[ordem]
+        self.P = autovetores[:, ordem]
+        self.P_inversa = inv(self.P)
+
+        # Acumulador de A'(m); real quando todo o espectro é real
+        self._m_atual = 0
+        self._acumulada = zeros((self.n, self.n), dtype=self.P.dtype)
+
+    def _somar_termos(self, inicio, fim, sinal):
+        """Soma (ou subtrai) os termos λᵢ pᵢ qᵢᵀ para i em [inicio, fim)."""
+        termos = (self.P[:, inicio:fim] * self.autovalores[inicio:fim]) @ self.P_inversa[inicio:fim]
+        if sinal > 0:
+            self._acumulada += termos
+        else:
+            self._acumulada -= termos
+
+    def matriz(self, num_autovalores_manter):
+        """Retorna A'(m), com os m autovalores de maior módulo, por atualizações de posto um."""
+        m = num_autovalores_manter
+        if not 0 <= m <= self.n:
+            raise ValueError(f"O número de autovalores a manter (m={m}) deve estar entre 0 e n={self.n}.")
+
+        if m > self._m_atual:
+            self._somar_termos(self._m_atual, m, +1)
+        elif m < self._m_atual:
+            self._somar_termos(m, self._m_atual, -1)
+        self._m_atual = m
+
+        return self._acumulada.real.copy()
+
+    def erros_truncamento(self):
+        """
+            Retorna um array (n+1,) com ||A - A'(m)||_F para m = 0, 1, ..., n.
+
+            Com T_m = Σ_{i≥m} λᵢ pᵢ qᵢᵀ, o erro da parte real é
+            ||Re T_m||_F² = (||T_m||_F² + Re Σ_kl (T_m)_kl²) / 2, e as duas somas
+            são somas de blocos finais de matrizes de Gram n x n, obtidas todas de
+            uma vez por somas acumuladas.
+        """
+        c = self.autovalores
+        P, Q = self.P, self.P_inversa
+
+        # M[j, i] = c̄_j c_i (p_jᴴ p_i)(q_jᴴ q_i)   ->  Σ |T_m|²
+        M = (conj(c)[:, None] * c[None, :]) * (conj(P.T) @ P) * (conj(Q) @ Q.T)
+        soma_total = M.real
+        if iscomplexobj(P):
+            # N[j, i] = c_j c_i (p_jᵀ p_i)(q_jᵀ q_i)   ->  Σ T_m²
+            N = (c[:, None] * c[None, :]) * (P.T @ P) * (Q @ Q.T)
+            soma_total = (soma_total + N.real) / 2
+
+        # Soma do bloco [m:, m:] para todo m, via somas acumuladas invertidas
+        caudas = soma_total[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1]
+
+        erros = zeros(self.n + 1)
+        erros[:self.n] = sqrt(abs(caudas.diagonal()))
+        return erros
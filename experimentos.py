@@ -0,0 +1,199 @@
+"""
+Executor de experimentos sem interface gráfica para os estudos de posto/norma
+(lista_02_questao_04) e de condicionamento (lista_03_questao_05).
+
+A grade (n, tentativa) é distribuída em um pool de processos. Cada tarefa tem
+sua própria semente, derivada de (semente, n, tentativa), de modo que o
+resultado não depende de qual processo a executou nem da ordem de execução.
+Os resultados são gravados linha a linha em CSV; uma execução interrompida é
+retomada pulando os pares (n, tentativa) já gravados. Gráficos só são gerados
+quando pedidos, direto para arquivo.
+
+Exemplo:
+    python experimentos.py condicionamento --n 1 2 3 4 5 --tentativas 20 \\
+        --csv cond.csv --npz cond.npz --grafico cond.png
+"""
+import argparse
+import csv
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+from lista_02_questao_04 import MatrizPostoBaixo
+from lista_03_questao_05 import wilkinson_bidiagonal
+
+# Acima desta dimensão o estudo de posto/norma usa a representação fatorada
+LIMITE_DENSO = 2000
+
+
+def _tarefa_posto_norma(n, rng):
+    """Uma tentativa do estudo de lista_02_questao_04: A = u v.T com u, v uniformes."""
+    u = rng.random((n, 1))
+    v = rng.random((n, 1))
+    if n > LIMITE_DENSO:
+        A = MatrizPostoBaixo(u, v)
+        posto, norma_A = A.posto(), A.norma2()
+    else:
+        A = u @ v.T
+        posto, norma_A = np.linalg.matrix_rank(A), np.linalg.norm(A, 2)
+
+    norma_u = np.linalg.norm(u, 2)
+    norma_v = np.linalg.norm(v, 2)
+    return {
+        "posto": int(posto),
+        "norma_u": norma_u,
+        "norma_v": norma_v,
+        "norma_A": norma_A,
+        "produto_normas": norma_u * norma_v,
+    }
+
+
+def _tarefa_condicionamento(n, rng, magnitude=1e-10):
+    """Uma tentativa do estudo de lista_03_questao_05: cond(A) e efeito de uma perturbação."""
+    A = wilkinson_bidiagonal(n)
+    autovalores = np.sort(np.real(np.linalg.eigvals(A)))
+    perturbados = np.sort(np.real(np.linalg.eigvals(A + magnitude * rng.standard_normal((n, n)))))
+    return {
+        "cond": np.linalg.cond(A),
+        "desvio_max_autovalores": np.abs(perturbados - autovalores).max(),
+    }
+
+
+# Estudo -> (função da tarefa, colunas de resultado, coluna usada no gráfico)
+ESTUDOS = {
+    "posto_norma": (_tarefa_posto_norma,
+                    ["posto", "norma_u", "norma_v", "norma_A", "produto_normas"],
+                    "norma_A"),
+    "condicionamento": (_tarefa_condicionamento,
+                        ["cond", "desvio_max_autovalores"],
+                        "cond"),
+}
+
+
+def _executar_tarefa(argumentos):
+    """Executa uma tarefa no processo trabalhador (precisa ser de nível de módulo para o pickle)."""
+    estudo, n, tentativa, semente = argumentos
+    rng = np.random.default_rng(np.random.SeedSequence([semente, n, tentativa]))
+    resultado = ESTUDOS[estudo][0](n, rng)
+    return {"n": n, "tentativa": tentativa, **resultado}
+
+
+def _ler_csv(arquivo_csv):
+    """
+    Lê os resultados já gravados (lista de dicionários com valores numéricos),
+    ignorando linhas incompletas (campos faltando ou vazios).
+    """
+    if not os.path.exists(arquivo_csv):
+        return []
+    with open(arquivo_csv, newline="") as arquivo:
+        return [{chave: float(valor) for chave, valor in linha.items()}
+                for linha in csv.DictReader(arquivo)
+                if None not in linha and all(valor not in (None, "") for valor in linha.values())]
+
+
+def _descartar_linha_parcial(arquivo_csv):
+    """
+    Remove uma última linha sem quebra de linha, deixada por uma execução
+    interrompida no meio da escrita: mesmo que seus campos sejam legíveis, o último
+    pode estar truncado. Assim o arquivo sempre termina em "\n" antes de acrescentar.
+    """
+    if not os.path.exists(arquivo_csv) or os.path.getsize(arquivo_csv) == 0:
+        return
+    with open(arquivo_csv, "rb+") as arquivo:
+        conteudo = arquivo.read()
+        if not conteudo.endswith(b"\n"):
+            arquivo.truncate(conteudo.rfind(b"\n") + 1)
+
+
+def _salvar_grafico(colunas, coluna_y, arquivo_grafico, titulo):
+    """Desenha a média de 'coluna_y' por n e grava em arquivo, sem abrir janela."""
+    from matplotlib.figure import Figure  # sem pyplot: nenhum backend interativo é usado
+
+    valores_n = np.unique(colunas["n"])
+    medias = [colunas[coluna_y][colunas["n"] == n].mean() for n in valores_n]
+
+    figura = Figure(figsize=(8, 5))
+    eixo = figura.add_subplot()
+    eixo.plot(valores_n, medias, marker='o')
+    if np.all(np.asarray(medias) > 0):
+        eixo.set_yscale("log")
+    eixo.set_title(titulo)
+    eixo.set_xlabel("Ordem n")
+    eixo.set_ylabel(f"{coluna_y} (média)")
+    eixo.grid(True)
+    figura.savefig(arquivo_grafico)
+
+
+def executar_experimentos(estudo, valores_n, tentativas, arquivo_csv, semente=0, processos=None,
+                          arquivo_npz=None, arquivo_grafico=None):
+    """
+    Executa o estudo 'estudo' ("posto_norma" ou "condicionamento") para cada n em
+    valores_n e cada tentativa em range(tentativas), em um pool com 'processos'
+    processos (None = número de CPUs; 1 = no próprio processo).
+
+    Cada resultado é acrescentado a arquivo_csv assim que fica pronto. Pares
+    (n, tentativa) que já estão no CSV não são recalculados. Ao final, o CSV
+    completo pode ser consolidado em arquivo_npz e resumido em arquivo_grafico.
+
+    Retorna um dicionário coluna -> array com todos os resultados do CSV.
+    """
+    if estudo not in ESTUDOS:
+        raise ValueError(f"Estudo desconhecido: {estudo!r}. Opções: {', '.join(ESTUDOS)}.")
+    _, colunas_resultado, coluna_grafico = ESTUDOS[estudo]
+    campos = ["n", "tentativa"] + colunas_resultado
+
+    _descartar_linha_parcial(arquivo_csv)
+    concluidos = {(int(linha["n"]), int(linha["tentativa"])) for linha in _ler_csv(arquivo_csv)}
+    pendentes = [(estudo, int(n), tentativa, semente)
+                 for n in valores_n for tentativa in range(tentativas)
+                 if (int(n), tentativa) not in concluidos]
+
+    arquivo_novo = not os.path.exists(arquivo_csv) or os.path.getsize(arquivo_csv) == 0
+    with open(arquivo_csv, "a", newline="") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=campos)
+        if arquivo_novo:
+            escritor.writeheader()
+
+        if processos == 1:
+            resultados = map(_executar_tarefa, pendentes)
+            pool = None
+        else:
+            pool = Pool(processos)
+            resultados = pool.imap_unordered(_executar_tarefa, pendentes)
+
+        try:
+            for linha in resultados:
+                escritor.writerow(linha)
+                arquivo.flush()
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    linhas = _ler_csv(arquivo_csv)
+    colunas = {campo: np.array([linha[campo] for linha in linhas]) for campo in campos}
+
+    if arquivo_npz is not None:
+        np.savez(arquivo_npz, **colunas)
+    if arquivo_grafico is not None:
+        _salvar_grafico(colunas, coluna_grafico, arquivo_grafico, f"Estudo {estudo}")
+
+    return colunas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("estudo", choices=sorted(ESTUDOS))
+    parser.add_argument("--n", type=int, nargs="+", required=True, help="valores de n")
+    parser.add_argument("--tentativas", type=int, default=1)
+    parser.add_argument("--csv", required=True, help="arquivo CSV de resultados (retomável)")
+    parser.add_argument("--npz", default=None, help="consolida os resultados em .npz")
+    parser.add_argument("--grafico", default=None, help="grava o gráfico neste arquivo")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--processos", type=int, default=None)
+    argumentos = parser.parse_args()
+
+    executar_experimentos(argumentos.estudo, argumentos.n, argumentos.tentativas, argumentos.csv,
+                          semente=argumentos.semente, processos=argumentos.processos,
+                          arquivo_npz=argumentos.npz, arquivo_grafico=argumentos.grafico)
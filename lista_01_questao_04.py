@@ -57,19 +57,134 @@ class backsolve:
             print(f"x[{i+1},1] = ", x[i])
             print(x)
 
+        self.x = x
+
+# Função de resolução triangular (silenciosa, vetorizada e com múltiplos lados direitos)
+def resolver_triangular(A, b, inferior=False, validar=True, tamanho_bloco=256):
+    """
+    Resolve A x = b para A triangular (superior por padrão, inferior se inferior=True)
+    e retorna x, sem imprimir nada.
+
+    b pode ser um vetor (n,) ou uma matriz (n, k) com k lados direitos. A matriz é
+    percorrida em blocos de 'tamanho_bloco' linhas: cada bloco diagonal é resolvido
+    linha a linha (cada linha atualiza todos os lados direitos de uma vez) e a
+    contribuição do bloco já resolvido é retirada das linhas restantes com um único
+    produto de matrizes.
+
+    Se validar=True, verifica as dimensões, se A é triangular e se a diagonal não
+    tem zeros; com validar=False essas verificações são puladas.
+    """
+    A = np.asarray(A)
+    b = np.asarray(b)
+    n = A.shape[0]
+
+    if validar:
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("A não é uma matriz quadrada. Utilize uma matriz quadrada para A.")
+        if b.ndim not in (1, 2) or b.shape[0] != n:
+            raise ValueError("A e b não possuem dimensões compatíveis para o produto.")
+
+        # Verificação da parte que deve ser nula, por blocos de linhas
+        for inicio in range(0, n, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, n)
+            bloco = A[inicio:fim, inicio:fim]
+            if inferior:
+                fora = A[inicio:fim, fim:].any() or np.triu(bloco, 1).any()
+            else:
+                fora = A[inicio:fim, :inicio].any() or np.tril(bloco, -1).any()
+            if fora:
+                tipo = "inferior" if inferior else "superior"
+                raise ValueError(f"Não é uma matriz triangular {tipo}.")
+
+        diagonal_nula = np.flatnonzero(np.diagonal(A) == 0)
+        if diagonal_nula.size:
+            i = diagonal_nula[0]
+            raise ValueError(f"Elemento nulo na diagonal principal na posição {i+1},{i+1}. Certfique-se que a diagonal principal da matriz A não possua valor 0.")
+
+    # x começa como cópia de b e vai sendo sobrescrito pela solução
+    x = np.array(b, dtype=np.result_type(A, b, float))
+    x_2d = x.reshape(n, -1)
+
+    if inferior:
+        blocos = [(i, min(i + tamanho_bloco, n)) for i in range(0, n, tamanho_bloco)]
+    else:
+        blocos = [(max(f - tamanho_bloco, 0), f) for f in range(n, 0, -tamanho_bloco)]
+
+    for inicio, fim in blocos:
+        # Substituição dentro do bloco diagonal
+        linhas = range(inicio, fim) if inferior else range(fim - 1, inicio - 1, -1)
+        for i in linhas:
+            if inferior:
+                x_2d[i] -= A[i, inicio:i] @ x_2d[inicio:i]
+            else:
+                x_2d[i] -= A[i, i + 1:fim] @ x_2d[i + 1:fim]
+            x_2d[i] /= A[i, i]
+
+        # Atualização das linhas restantes com o bloco resolvido (produto de matrizes)
+        if inferior:
+            x_2d[fim:] -= A[fim:, inicio:fim] @ x_2d[inicio:fim]
+        else:
+            x_2d[:inicio] -= A[:inicio, inicio:fim] @ x_2d[inicio:fim]
+
+    return x
+
+# Substituição regressiva fora da memória (out-of-core), por blocos de linhas
+def backsolve_memmap(A, b, tamanho_bloco=1024):
+    """
+    Resolve A x = b para A triangular superior armazenada em disco, lendo
+    np.memmap por faixas de 'tamanho_bloco' linhas, da última para a primeira.
+
+    A pode ser o caminho de um arquivo .npy (aberto como memmap somente leitura)
+    ou um np.memmap/array já aberto. A cada passo apenas a faixa A[i0:i1, i0:]
+    (parte triangular superior das linhas do bloco) e a solução parcial ficam em
+    memória. A triangularidade não é verificada, pois exigiria ler a matriz inteira.
+
+    Retorna a tupla (x, bytes_lidos), onde 'bytes_lidos' é o total lido de A,
+    útil para ajustar 'tamanho_bloco' ao sistema de E/S.
+    """
+    if isinstance(A, (str, bytes)) or hasattr(A, "__fspath__"):
+        A = np.load(A, mmap_mode='r')
+
+    b = np.asarray(b)
+    n = A.shape[0]
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("A não é uma matriz quadrada. Utilize uma matriz quadrada para A.")
+    if b.ndim not in (1, 2) or b.shape[0] != n:
+        raise ValueError("A e b não possuem dimensões compatíveis para o produto.")
+
+    x = np.array(b, dtype=np.result_type(A.dtype, b, float))
+    x_2d = x.reshape(n, -1)
+    bytes_lidos = 0
+
+    for fim in range(n, 0, -tamanho_bloco):
+        inicio = max(fim - tamanho_bloco, 0)
+
+        # Lê a faixa de linhas do bloco, apenas da diagonal para a direita
+        faixa = np.array(A[inicio:fim, inicio:])
+        bytes_lidos += faixa.nbytes
+
+        # Retira a contribuição das incógnitas já resolvidas e resolve o bloco diagonal
+        largura = fim - inicio
+        x_2d[inicio:fim] -= faixa[:, largura:] @ x_2d[fim:]
+        x_2d[inicio:fim] = resolver_triangular(faixa[:, :largura], x_2d[inicio:fim], validar=False)
+
+    return x, bytes_lidos
+
 # Exemplo de execução
-A = np.array([
-    [1, 2, 6, 0],
-    [0, 1, 6, 1],
-    [0, 0, 1, 1],
-    [0, 0, 0, 1]
-])
-
-b = np.array([
-    [1],
-    [4],
-    [1],
-    [1]
-])
-
-backsubstitution_obj = backsolve(A, b)
+if __name__ == "__main__":
+    A = np.array([
+        [1, 2, 6, 0],
+        [0, 1, 6, 1],
+        [0, 0, 1, 1],
+        [0, 0, 0, 1]
+    ])
+
+    b = np.array([
+        [1],
+        [4],
+        [1],
+        [1]
+    ])
+
+    x = resolver_triangular(A, b)
+    print("x (resolver_triangular): \n", x)
@@ -1,4 +1,7 @@
+import os
+
 import numpy as np
+from scipy import ndimage
 
 # Função Posição Efetuador Final
 def posicao_efetuador(theta1_graus, theta2_graus, L1=20.0, L2=15.0):
@@ -23,5 +26,207 @@ def posicao_efetuador(theta1_graus, theta2_graus, L1=20.0, L2=15.0):
 
     return XU, YU
 
+# Função Posição Efetuador Final em lote (cadeia com n elos)
+def posicao_efetuador_lote(angulos_graus, comprimentos=(20.0, 15.0), dtype=np.float64, out=None):
+    """
+    Calcula a posição do efetuador final para N poses de uma cadeia planar de elos.
+
+    angulos_graus tem forma (N, elos), com o ângulo relativo de cada junta em graus
+    (para um único elo, (N,) também é aceito). comprimentos traz o comprimento de
+    cada elo. A posição é soma_k L_k (cos(phi_k), sin(phi_k)), com phi_k a soma
+    acumulada dos ângulos até a junta k.
+
+    Ao contrário de posicao_efetuador, não imprime, não arredonda e não limita os
+    ângulos a [0, 360]. dtype permite usar float32; out recebe um array (N, 2) já
+    alocado. Retorna o array (N, 2) com (X, Y) de cada pose.
+    """
+    angulos = np.asarray(angulos_graus, dtype=dtype)
+    comprimentos = np.asarray(comprimentos, dtype=dtype)
+
+    if angulos.ndim == 1:
+        angulos = angulos[:, np.newaxis]
+    if angulos.ndim != 2 or comprimentos.ndim != 1 or angulos.shape[1] != comprimentos.shape[0]:
+        raise ValueError("Os angulos devem ter forma (N, elos), com um comprimento por elo.")
+
+    N = angulos.shape[0]
+    if out is None:
+        out = np.empty((N, 2), dtype=dtype)
+    elif out.shape != (N, 2):
+        raise ValueError(f"O buffer out deve ter forma ({N}, 2).")
+
+    # Angulos acumulados em radianos, calculados num único buffer
+    fase = np.radians(angulos)
+    np.cumsum(fase, axis=1, out=fase)
+
+    np.matmul(np.cos(fase), comprimentos, out=out[:, 0])
+    np.sin(fase, out=fase)
+    np.matmul(fase, comprimentos, out=out[:, 1])
+
+    return out
+
+# Cinemática inversa em lote para o braço de 2 elos (L1, L2)
+def cinematica_inversa_lote(alvos, L1=20.0, L2=15.0, tol=1e-9):
+    """
+    Calcula, em forma fechada, os angulos (theta1, theta2) em graus que levam o
+    efetuador final do braço de 2 elos a cada um dos N alvos (X, Y).
+
+    Pela lei dos cossenos, cos(theta2) = (X² + Y² - L1² - L2²) / (2 L1 L2); as duas
+    soluções diferem pelo sinal de theta2. Na solução "cotovelo para baixo" theta2
+    é positivo (sentido anti-horário) e na "cotovelo para cima" é negativo. Os
+    angulos são devolvidos em [0, 360), o mesmo intervalo de posicao_efetuador.
+
+    Retorna a tupla (cotovelo_cima, cotovelo_baixo, alcancavel): dois arrays (N, 2)
+    com os angulos de cada solução (NaN para alvos fora do alcance) e a máscara (N,)
+    dos alvos alcançáveis, isto é, com |L1 - L2| <= distância <= L1 + L2 (a menos de tol).
+    """
+    alvos = np.asarray(alvos, dtype=float)
+    if alvos.ndim != 2 or alvos.shape[1] != 2:
+        raise ValueError("Os alvos devem formar um array de forma (N, 2).")
+
+    x, y = alvos[:, 0], alvos[:, 1]
+    cos_theta2 = (x * x + y * y - L1 * L1 - L2 * L2) / (2.0 * L1 * L2)
+    alcancavel = np.abs(cos_theta2) <= 1.0 + tol
+    np.clip(cos_theta2, -1.0, 1.0, out=cos_theta2)
+    sen_theta2 = np.sqrt(1.0 - cos_theta2 * cos_theta2)
+
+    # Angulo do alvo e correção devida ao segundo elo
+    base = np.arctan2(y, x)
+    correcao = np.arctan2(L2 * sen_theta2, L1 + L2 * cos_theta2)
+    theta2 = np.arctan2(sen_theta2, cos_theta2)
+
+    cotovelo_baixo = np.empty_like(alvos)
+    cotovelo_baixo[:, 0] = base - correcao
+    cotovelo_baixo[:, 1] = theta2
+
+    cotovelo_cima = np.empty_like(alvos)
+    cotovelo_cima[:, 0] = base + correcao
+    cotovelo_cima[:, 1] = -theta2
+
+    for solucao in (cotovelo_cima, cotovelo_baixo):
+        np.degrees(solucao, out=solucao)
+        np.mod(solucao, 360.0, out=solucao)
+        solucao[~alcancavel] = np.nan
+
+    return cotovelo_cima, cotovelo_baixo, alcancavel
+
+def verificar_cinematica_inversa(alvos, solucao, alcancavel, L1=20.0, L2=15.0, amostras=1000, semente=0):
+    """
+    Verificação de ida e volta da cinemática inversa numa amostra dos alvos alcançáveis:
+    aplica posicao_efetuador_lote aos angulos de 'solucao' e retorna o maior erro de
+    posição (distância euclidiana, mesma unidade de L1 e L2) na amostra.
+    """
+    alvos = np.asarray(alvos, dtype=float)
+    indices = np.flatnonzero(alcancavel)
+    if indices.size == 0:
+        return 0.0
+
+    rng = np.random.default_rng(semente)
+    if indices.size > amostras:
+        indices = rng.choice(indices, size=amostras, replace=False)
+
+    posicoes = posicao_efetuador_lote(solucao[indices], comprimentos=(L1, L2))
+    return float(np.max(np.hypot(*(posicoes - alvos[indices]).T)))
+
+# Tabela pré-calculada do espaço de trabalho, com interpolação
+class TabelaEspacoTrabalho:
+    """
+    Tabela pré-calculada das posições do efetuador final do braço (L1, L2) sobre
+    uma grade periódica em (theta1, theta2), consultada por interpolação bilinear
+    ou cúbica (spline) em vez de avaliar seno e cosseno a cada consulta.
+
+    A resolução da grade é escolhida a partir de erro_max, a cota desejada para o
+    erro de posição (mesma unidade de L1 e L2). Com passo h em radianos:
+        bilinear: erro <= h² (L1 + 2 L2) / 8
+        cubica:   erro <= 5 h⁴ (L1 + 2 L2) / 384   (cota clássica do spline cúbico)
+    Também é possível fixar a resolução (pontos por eixo) diretamente.
+
+    Se diretorio_cache for informado, a tabela é gravada em um arquivo .npy cujo
+    nome identifica a geometria, o método e a resolução, e nas execuções seguintes
+    é aberta como memmap em vez de ser recalculada.
+    """
+
+    def __init__(self, L1=20.0, L2=15.0, erro_max=1e-3, metodo="bilinear",
+                 resolucao=None, diretorio_cache=None):
+        if metodo not in ("bilinear", "cubica"):
+            raise ValueError("O metodo deve ser 'bilinear' ou 'cubica'.")
+
+        self.L1 = float(L1)
+        self.L2 = float(L2)
+        self.metodo = metodo
+
+        if resolucao is None:
+            if erro_max <= 0:
+                raise ValueError("O erro_max deve ser positivo.")
+            curvatura = self.L1 + 2.0 * self.L2
+            if metodo == "bilinear":
+                passo = np.sqrt(8.0 * erro_max / curvatura)
+            else:
+                passo = (384.0 * erro_max / (5.0 * curvatura)) ** 0.25
+            resolucao = int(np.ceil(2.0 * np.pi / passo))
+        self.resolucao = max(int(resolucao), 4)
+        self.passo_graus = 360.0 / self.resolucao
+
+        self.tabela = self._carregar_ou_construir(diretorio_cache)
+
+    def _nome_arquivo(self):
+        return (f"espaco_trabalho_{self.metodo}_L1_{self.L1:.17g}_L2_{self.L2:.17g}"
+                f"_n_{self.resolucao}.npy")
+
+    def _construir(self):
+        angulos = np.arange(self.resolucao) * self.passo_graus
+        theta1, theta2 = np.meshgrid(angulos, angulos, indexing="ij")
+        poses = np.stack([theta1.ravel(), theta2.ravel()], axis=1)
+        tabela = posicao_efetuador_lote(poses, comprimentos=(self.L1, self.L2))
+        tabela = tabela.reshape(self.resolucao, self.resolucao, 2)
+
+        if self.metodo == "cubica":
+            # Guarda os coeficientes do spline, para consultar sem refazer o pré-filtro
+            for eixo in range(2):
+                tabela[..., eixo] = ndimage.spline_filter(tabela[..., eixo], order=3, mode="grid-wrap")
+        return tabela
+
+    def _carregar_ou_construir(self, diretorio_cache):
+        if diretorio_cache is None:
+            return self._construir()
+
+        caminho = os.path.join(diretorio_cache, self._nome_arquivo())
+        if not os.path.exists(caminho):
+            os.makedirs(diretorio_cache, exist_ok=True)
+            temporario = f"{caminho}.{os.getpid()}.tmp"
+            with open(temporario, "wb") as arquivo:
+                np.save(arquivo, self._construir())
+            os.replace(temporario, caminho)  # outro processo nunca vê o arquivo pela metade
+        return np.load(caminho, mmap_mode="r")
+
+    def posicao(self, theta1_graus, theta2_graus):
+        """Retorna um array (N, 2) com as posições interpoladas para os angulos (em graus) dados."""
+        u = np.ravel(np.asarray(theta1_graus, dtype=float)) / self.passo_graus
+        v = np.ravel(np.asarray(theta2_graus, dtype=float)) / self.passo_graus
+        if u.shape != v.shape:
+            raise ValueError("theta1_graus e theta2_graus devem ter o mesmo tamanho.")
+
+        if self.metodo == "cubica":
+            coordenadas = np.stack([u, v])
+            saida = np.empty((u.size, 2))
+            for eixo in range(2):
+                ndimage.map_coordinates(self.tabela[..., eixo], coordenadas, output=saida[:, eixo],
+                                        order=3, mode="grid-wrap", prefilter=False)
+            return saida
+
+        # Bilinear, com a grade periódica nos dois angulos
+        i = np.floor(u)
+        j = np.floor(v)
+        fu = (u - i)[:, np.newaxis]
+        fv = (v - j)[:, np.newaxis]
+        i = i.astype(np.intp) % self.resolucao
+        j = j.astype(np.intp) % self.resolucao
+        i1 = (i + 1) % self.resolucao
+        j1 = (j + 1) % self.resolucao
+
+        T = self.tabela
+        return ((T[i, j] * (1.0 - fv) + T[i, j1] * fv) * (1.0 - fu)
+                + (T[i1, j] * (1.0 - fv) + T[i1, j1] * fv) * fu)
+
 # Exemplo de execução
-posicao_efetuador(90, 0)
+if __name__ == "__main__":
+    posicao_efetuador(90, 0)
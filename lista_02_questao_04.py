@@ -1,17 +1,184 @@
 import numpy as np
 
-def analise_posto_norma(n_valor):
+class MatrizPostoBaixo:
+    """
+    Matriz de posto baixo A = U @ V.T representada apenas pelos fatores
+    U (n x k) e V (m x k), sem formar a matriz densa n x m.
+
+    Posto e normas saem dos fatores: com U = Qu Ru e V = Qv Rv (QR reduzida),
+    A = Qu (Ru Rv.T) Qv.T, logo os valores singulares de A sao os da matriz
+    k x k Ru Rv.T. O custo e O((n + m) k^2) em vez de O(n^3).
+    """
+
+    def __init__(self, U, V):
+        U = np.asarray(U, dtype=float)
+        V = np.asarray(V, dtype=float)
+        if U.ndim == 1:
+            U = U[:, np.newaxis]
+        if V.ndim == 1:
+            V = V[:, np.newaxis]
+        if U.ndim != 2 or V.ndim != 2 or U.shape[1] != V.shape[1]:
+            raise ValueError("U e V devem ser matrizes com o mesmo numero de colunas k.")
+
+        self.U = U
+        self.V = V
+        self.shape = (U.shape[0], V.shape[0])
+        self._valores_singulares = None
+
+    def matvec(self, x):
+        """Produto A @ x, calculado como U @ (V.T @ x)."""
+        return self.U @ (self.V.T @ x)
+
+    def rmatvec(self, y):
+        """Produto A.T @ y, calculado como V @ (U.T @ y)."""
+        return self.V @ (self.U.T @ y)
+
+    def valores_singulares(self):
+        """Valores singulares nao nulos (no maximo k) de A, em ordem decrescente."""
+        if self._valores_singulares is None:
+            Ru = np.linalg.qr(self.U, mode='r')
+            Rv = np.linalg.qr(self.V, mode='r')
+            self._valores_singulares = np.linalg.svd(Ru @ Rv.T, compute_uv=False)
+        return self._valores_singulares
+
+    def posto(self, tol=None):
+        """Posto numerico, com a mesma tolerancia padrao de np.linalg.matrix_rank."""
+        s = self.valores_singulares()
+        if s.size == 0:
+            return 0
+        if tol is None:
+            tol = s.max() * max(self.shape) * np.finfo(float).eps
+        return int(np.count_nonzero(s > tol))
+
+    def norma2(self):
+        """Norma 2 (espectral): o maior valor singular."""
+        s = self.valores_singulares()
+        return float(s[0]) if s.size else 0.0
+
+    def norma_frobenius(self):
+        """Norma de Frobenius: ||U V.T||_F^2 = soma((U.T U) * (V.T V))."""
+        return float(np.sqrt(max(np.sum((self.U.T @ self.U) * (self.V.T @ self.V)), 0.0)))
+
+    def densa(self):
+        """Converte para a matriz densa n x m (apenas para n pequeno)."""
+        return self.U @ self.V.T
+
+# Esbocos aleatorios (Halko, Martinsson e Tropp, 2011) para posto e norma 2.
+# Todas as funcoes recebem a semente explicitamente: a mesma semente reproduz
+# exatamente o mesmo resultado.
+
+def _ortonormalizar(Y, Q=None):
+    """Base ortonormal de Y, projetada para fora de span(Q) com reortogonalizacao."""
+    if Q is not None and Q.shape[1]:
+        for _ in range(2):
+            Y = Y - Q @ (Q.T @ Y)
+    return np.linalg.qr(Y)[0]
+
+def faixa_aleatoria(A, k, sobreamostragem=10, iteracoes_potencia=2, semente=0):
+    """
+    Base ortonormal Q (n x l), com l = k + sobreamostragem, que aproxima a imagem
+    de A a partir do esboco Y = A @ Omega (Omega gaussiana). As iteracoes de
+    potencia melhoram a aproximacao quando os valores singulares decaem devagar.
+    Custo O(m n l) por passagem sobre A.
+    """
+    A = np.asarray(A)
+    m, n = A.shape
+    l = min(k + sobreamostragem, m, n)
+    rng = np.random.default_rng(semente)
+
+    Q = _ortonormalizar(A @ rng.standard_normal((n, l)))
+    for _ in range(iteracoes_potencia):
+        Z = _ortonormalizar(A.T @ Q)
+        Q = _ortonormalizar(A @ Z)
+    return Q
+
+def valores_singulares_aleatorios(A, k, sobreamostragem=10, iteracoes_potencia=2, semente=0):
+    """Os k maiores valores singulares de A, estimados por Q.T @ A com Q de faixa_aleatoria."""
+    Q = faixa_aleatoria(A, k, sobreamostragem, iteracoes_potencia, semente)
+    return np.linalg.svd(Q.T @ np.asarray(A), compute_uv=False)[:k]
+
+def posto_numerico_aleatorio(A, tol=None, bloco=10, vetores_teste=10, semente=0):
+    """
+    Posto numerico de A (numero de valores singulares acima de tol) por um
+    esboco adaptativo: a base Q cresce em blocos de 'bloco' colunas ate que a
+    estimativa a posteriori do residuo fique abaixo de tol, isto e,
+        ||(I - Q Q.T) A||_2 <= 10 sqrt(2/pi) max_i ||(I - Q Q.T) A w_i||,
+    que vale com probabilidade >= 1 - 10**(-vetores_teste) (w_i gaussianos).
+    Custo O(m n r) para posto r. Com tol=None, usa a mesma tolerancia padrao de
+    np.linalg.matrix_rank, com ||A||_2 estimada por norma2_aleatoria.
+
+    Retorna a tupla (posto, valores_singulares) com os valores singulares de Q.T @ A.
+    """
+    A = np.asarray(A)
+    m, n = A.shape
+    rng = np.random.default_rng(semente)
+
+    if tol is None:
+        estimativa, _ = norma2_aleatoria(A, semente=semente)
+        tol = estimativa * max(m, n) * np.finfo(float).eps
+
+    fator = 10.0 * np.sqrt(2.0 / np.pi)
+    residuo_teste = A @ rng.standard_normal((n, vetores_teste))
+    Q = np.zeros((m, 0))
+
+    while Q.shape[1] < min(m, n):
+        if fator * np.linalg.norm(residuo_teste, axis=0).max() <= tol:
+            break
+        largura = min(bloco, min(m, n) - Q.shape[1])
+        Q_novo = _ortonormalizar(A @ rng.standard_normal((n, largura)), Q)
+        Q = np.hstack([Q, Q_novo])
+        residuo_teste -= Q_novo @ (Q_novo.T @ residuo_teste)
+
+    s = np.linalg.svd(Q.T @ A, compute_uv=False)
+    return int(np.count_nonzero(s > tol)), s
+
+def norma2_aleatoria(A, iteracoes=30, prob_falha=1e-6, semente=0):
+    """
+    Estimativa de ||A||_2 pelo metodo da potencia em A.T A, com vetor inicial
+    gaussiano, mais uma cota superior a posteriori. A estimativa nunca passa de
+    ||A||_2; pela cota de Kuczynski e Wozniakowski (1992), apos k iteracoes
+        P(estimativa^2 < (1 - eps) ||A||_2^2) <= 0.824 sqrt(n) (1 - eps)**(k - 1/2),
+    de onde sai a cota superior que vale com probabilidade >= 1 - prob_falha.
+    Custo O(m n) por iteracao.
+
+    Retorna a tupla (estimativa, cota_superior).
+    """
+    A = np.asarray(A)
+    n = A.shape[1]
+    rng = np.random.default_rng(semente)
+
+    x = rng.standard_normal(n)
+    x /= np.linalg.norm(x)
+    for _ in range(iteracoes):
+        z = A.T @ (A @ x)
+        norma_z = np.linalg.norm(z)
+        if norma_z == 0:
+            return 0.0, 0.0
+        x = z / norma_z
+
+    estimativa = float(np.linalg.norm(A @ x))
+    expoente = max(iteracoes - 0.5, 0.5)
+    um_menos_eps = min((prob_falha / (0.824 * np.sqrt(n))) ** (1.0 / expoente), 1.0)
+    return estimativa, estimativa / np.sqrt(um_menos_eps)
+
+def analise_posto_norma(n_valor, fatorada=False):
     for n in n_valor:
         u = np.random.rand(n, 1)
         # print("u:", u)
         v = np.random.rand(n, 1)
         # print("v:", v)
-        A = u @ v.T  # Produto externo
-        
-        rank = np.linalg.matrix_rank(A)
+        if fatorada:
+            # Produto externo representado pelos fatores (viavel para n muito grande)
+            A = MatrizPostoBaixo(u, v)
+            rank = A.posto()
+            norm_A = A.norma2()
+        else:
+            A = u @ v.T  # Produto externo
+            rank = np.linalg.matrix_rank(A)
+            norm_A = np.linalg.norm(A, 2)  # Norma 2 (espectral)
+
         norm_u = np.linalg.norm(u, 2)
         norm_v = np.linalg.norm(v, 2)
-        norm_A = np.linalg.norm(A, 2)  # Norma 2 (espectral)
 
         print(f"n = {n}")
         print(f"Posto de A = {rank}")
@@ -21,8 +188,12 @@ def analise_posto_norma(n_valor):
         print(f"||u||_2 * ||v||_2 = {(norm_u*norm_v)}")
         print("-" * 40)
 
-# Teste com diferentes dimensoes n (5, 15, 25)
-n_dimensoes = [5, 15, 25]
+if __name__ == "__main__":
+    # Teste com diferentes dimensoes n (5, 15, 25)
+    n_dimensoes = [5, 15, 25]
+
+    # Execucao
+    analise_posto_norma(n_dimensoes)
 
-# Execucao
-analise_posto_norma(n_dimensoes)
\ No newline at end of file
+    # Mesmo estudo com a representacao fatorada, em dimensao grande
+    analise_posto_norma([10**6], fatorada=True)
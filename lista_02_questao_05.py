@@ -47,6 +47,103 @@ def is_orthogonal_by_vectors(A, tol=1e-5):
                 return False  # colunas não são ortogonais
     return True
 
+# ============================
+# Função 3: Verificação em lote, por blocos de colunas
+# ============================
+def is_orthogonal_batch(As, tol=1e-5, block_size=64, max_elements=2**24):
+    """
+    Verifica um lote de matrizes (B, m, n) de uma só vez: para cada matriz,
+    testa se |A.T @ A - I| <= tol em todas as entradas (colunas ortonormais).
+
+    As colunas são processadas em blocos de 'block_size': para o bloco de colunas
+    [j0, j1) calcula-se apenas A[:, j0:j1].T @ A[:, :j1] (a parte triangular de
+    A.T @ A ainda não verificada), com produtos de matrizes para o lote inteiro.
+    Uma matriz reprovada sai do lote imediatamente, e a verificação termina assim
+    que todas forem reprovadas. Os produtos usam fatias (visões) de As, sem copiar
+    as colunas; 'max_elements' limita o número de elementos envolvidos em cada
+    produto (operando g x m x j1 e resultado g x bloco x j1), dividindo o lote
+    quando necessário.
+
+    Parâmetros:
+        As: array (B, m, n) ou uma única matriz (m, n)
+        tol: tolerância numérica
+        block_size: número de colunas por bloco
+        max_elements: número máximo de elementos do operando/produto de cada grupo
+
+    Retorna:
+        array booleano (B,) (ou um bool para uma única matriz)
+    """
+    As = np.asarray(As, dtype=float)
+    unica = As.ndim == 2
+    if unica:
+        As = As[np.newaxis]
+    if As.ndim != 3:
+        raise ValueError("As deve ter forma (B, m, n).")
+
+    B, m, n = As.shape
+    ortogonal = np.ones(B, dtype=bool)
+    if B == 0:
+        return ortogonal  # lote vazio
+    ativos = np.arange(B)
+
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+        identidade = np.eye(j1 - j0, j1, k=j0)  # linhas [j0, j1) da identidade
+
+        # Grupos de matrizes ativas consecutivas (fatias simples, sem cópia), com
+        # no máximo max_elements elementos no operando (g, m, j1) e no produto (g, bloco, j1)
+        tamanho_grupo = max(1, max_elements // (j1 * max(m, j1 - j0)))
+        quebras = np.flatnonzero(np.diff(ativos) != 1) + 1
+        reprovados = []
+        for sequencia in np.split(ativos, quebras):
+            for g0 in range(sequencia[0], sequencia[-1] + 1, tamanho_grupo):
+                g1 = min(g0 + tamanho_grupo, sequencia[-1] + 1)
+                G = np.matmul(As[g0:g1, :, j0:j1].transpose(0, 2, 1), As[g0:g1, :, :j1])
+                G -= identidade
+                np.abs(G, out=G)
+                reprovados.append(g0 + np.flatnonzero((G > tol).any(axis=(1, 2))))
+
+        reprovados = np.concatenate(reprovados) if reprovados else ativos[:0]
+        ortogonal[reprovados] = False
+        ativos = np.setdiff1d(ativos, reprovados, assume_unique=True)
+        if ativos.size == 0:
+            break  # todas reprovadas: não há mais o que verificar
+
+    return bool(ortogonal[0]) if unica else ortogonal
+
+# ============================
+# Função 4: Teste probabilístico O(n²)
+# ============================
+def is_orthogonal_randomized(A, tol=1e-5, num_vectors=10, seed=0):
+    """
+    Teste aleatório de ortogonalidade com custo O(m n k), sem formar A.T @ A.
+
+    Com E = A.T @ A - I e k vetores gaussianos x (colunas de X), calcula
+    E @ X = A.T @ (A @ X) - X e aceita A se ||E x||_2 <= tol / 4 para todo x.
+
+    Se alguma entrada de E tem módulo maior que tol, a linha i correspondente tem
+    norma r > tol e (E x)_i ~ N(0, r²); logo cada vetor aceita com probabilidade
+    no máximo sqrt(2/pi) / 4 < 0.2, e a probabilidade de falso aceite é
+        <= (sqrt(2/pi) / 4) ** num_vectors   (≈ 1e-7 para num_vectors = 10).
+    O teste pode rejeitar matrizes cujo erro é menor que tol entrada a entrada
+    mas grande em norma (muitas entradas próximas de tol).
+
+    Parâmetros:
+        A: matriz (m x n) (numpy array)
+        tol: tolerância numérica
+        num_vectors: número de vetores aleatórios k
+        seed: semente do gerador aleatório (resultado reprodutível)
+
+    Retorna:
+        True se A passou no teste, False caso contrário
+    """
+    A = np.asarray(A, dtype=float)
+    n = A.shape[1]
+    X = np.random.default_rng(seed).standard_normal((n, num_vectors))
+    EX = A.T @ (A @ X)
+    EX -= X
+    return bool(np.all(np.linalg.norm(EX, axis=0) <= tol / 4))
+
 # ============================
 # Matrizes dos Exercícios 6.38 e 6.39
 # ============================
@@ -85,9 +182,14 @@ matrizes = {
 }
 
 # Avaliação
-for nome, matriz in matrizes.items():
-    by_def = is_orthogonal_by_definition(matriz)
-    by_vec = is_orthogonal_by_vectors(matriz)
-    print(f"\n{nome}")
-    print(f" - Ortogonal pela definição? {'Sim' if by_def else 'Não'}")
-    print(f" - Ortogonal pelas colunas?   {'Sim' if by_vec else 'Não'}")
+if __name__ == "__main__":
+    for nome, matriz in matrizes.items():
+        by_def = is_orthogonal_by_definition(matriz)
+        by_vec = is_orthogonal_by_vectors(matriz)
+        print(f"\n{nome}")
+        print(f" - Ortogonal pela definição? {'Sim' if by_def else 'Não'}")
+        print(f" - Ortogonal pelas colunas?   {'Sim' if by_vec else 'Não'}")
+
+    # Mesma verificação para todas as matrizes de uma vez
+    em_lote = is_orthogonal_batch(np.stack(list(matrizes.values())))
+    print("\nOrtogonais (verificação em lote):", dict(zip(matrizes, em_lote.tolist())))
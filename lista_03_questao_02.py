@@ -32,36 +32,150 @@ def crossprod(u, v):
     
     return np.array([c1, c2, c3])
 
+def _check_stack(name, a):
+    """Converts a to an array and checks that its last axis has length 3."""
+    a = np.asarray(a)
+    if a.ndim == 0 or a.shape[-1] != 3:
+        raise ValueError(f"{name} must have shape (..., 3).")
+    return a
+
+def _prepare_out(out, shape, dtype, *inputs):
+    """Allocates out, or checks the given buffer's shape and that it does not overlap the inputs."""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out must have shape {shape}.")
+    if any(np.may_share_memory(out, a) for a in inputs):
+        raise ValueError("out must not overlap the input vectors.")
+    return out
+
+def crossprod_batch(u, v, out=None):
+    """
+    Computes the cross products u x v for stacks of 3D vectors.
+
+    Args:
+        u: Array of shape (N, 3) (or (3,), broadcast against v).
+        v: Array of shape (N, 3) (or (3,), broadcast against u).
+        out: Optional preallocated array with the broadcast shape, e.g. (N, 3).
+            It must not overlap u or v.
+
+    Returns:
+        The array of cross products, with shape (N, 3) (out, if given).
+
+    Raises:
+        ValueError: If the last axis of u or v is not 3, or out has the wrong shape.
+    """
+    u_arr = _check_stack("u", u)
+    v_arr = _check_stack("v", v)
+    shape = np.broadcast_shapes(u_arr.shape, v_arr.shape)
+    dtype = np.result_type(u_arr, v_arr)
+    out = _prepare_out(out, shape, dtype, u_arr, v_arr)
+    scratch = np.empty(shape[:-1], dtype=dtype)
+
+    # Same component formulas as crossprod, one whole-array operation each
+    for c, (i, j) in enumerate(((1, 2), (2, 0), (0, 1))):
+        np.multiply(u_arr[..., i], v_arr[..., j], out=out[..., c])
+        np.multiply(u_arr[..., j], v_arr[..., i], out=scratch)
+        out[..., c] -= scratch
+
+    return out
+
+def triple_product(u, v, w, out=None):
+    """
+    Computes the scalar triple products u . (v x w) for stacks of 3D vectors,
+    without building the intermediate cross product array.
+
+    The six monomials of det([u, v, w]) are accumulated into out using a single
+    scratch buffer.
+
+    Args:
+        u, v, w: Arrays of shape (N, 3) or (3,), broadcast against each other.
+        out: Optional preallocated array of shape (N,). It must not overlap the inputs.
+
+    Returns:
+        The array of scalar triple products, with shape (N,) (out, if given).
+    """
+    u_arr, v_arr, w_arr = _check_stack("u", u), _check_stack("v", v), _check_stack("w", w)
+    shape = np.broadcast_shapes(u_arr.shape, v_arr.shape, w_arr.shape)[:-1]
+    dtype = np.result_type(u_arr, v_arr, w_arr)
+    out = _prepare_out(out, shape, dtype, u_arr, v_arr, w_arr)
+    scratch = np.empty(shape, dtype=dtype)
+
+    out[...] = 0
+    # det([u, v, w]) = sum over even (i, j, k) of u_i v_j w_k - u_i v_k w_j
+    for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        np.multiply(v_arr[..., j], w_arr[..., k], out=scratch)
+        scratch *= u_arr[..., i]
+        out += scratch
+        np.multiply(v_arr[..., k], w_arr[..., j], out=scratch)
+        scratch *= u_arr[..., i]
+        out -= scratch
+
+    return out
+
+def vector_triple_product(u, v, w, out=None):
+    """
+    Computes the vector triple products u x (v x w) for stacks of 3D vectors,
+    using the identity u x (v x w) = v (u . w) - w (u . v).
+
+    Args:
+        u, v, w: Arrays of shape (N, 3) or (3,), broadcast against each other.
+        out: Optional preallocated array of shape (N, 3). It must not overlap the inputs.
+
+    Returns:
+        The array of vector triple products, with shape (N, 3) (out, if given).
+    """
+    u_arr, v_arr, w_arr = _check_stack("u", u), _check_stack("v", v), _check_stack("w", w)
+    shape = np.broadcast_shapes(u_arr.shape, v_arr.shape, w_arr.shape)
+    dtype = np.result_type(u_arr, v_arr, w_arr)
+    out = _prepare_out(out, shape, dtype, u_arr, v_arr, w_arr)
+
+    u_dot_w = np.einsum('...i,...i->...', u_arr, w_arr)
+    u_dot_v = np.einsum('...i,...i->...', u_arr, v_arr)
+    scratch = np.empty(shape[:-1], dtype=dtype)
+
+    for c in range(3):
+        np.multiply(v_arr[..., c], u_dot_w, out=out[..., c])
+        np.multiply(w_arr[..., c], u_dot_v, out=scratch)
+        out[..., c] -= scratch
+
+    return out
+
 # For the dot product, we can use NumPy's np.dot function
 # If you need to implement it:
 # def dotprod(a, b):
 #   return np.sum(np.asarray(a) * np.asarray(b))
 
-# Define vectors u and v
-u = np.array([1, 2, 3])
-v = np.array([4, 5, 6])
-
-print(f"Vector u = {u}")
-print(f"Vector v = {v}")
-print("-" * 30)
-
-# 1. Compute u x v
-u_cross_v = crossprod(u, v)
-print(f"u x v = {u_cross_v}")
-
-# 2. Compute v x u
-v_cross_u = crossprod(v, u)
-print(f"v x u = {v_cross_u}")
-print("(Note: v x u should be -(u x v))")
-print("-" * 30)
-
-# 3. Compute (u x v) . u
-# The dot product of (u x v) with u should be 0, as u_cross_v is orthogonal to u.
-dot_ucrossv_u = np.dot(u_cross_v, u)
-print(f"(u x v) . u = {dot_ucrossv_u}")
-print("-" * 30)
-
-# 4. Compute (v x u) . v
-# The dot product of (v x u) with v should be 0, as v_cross_u is orthogonal to v.
-dot_vcrossu_v = np.dot(v_cross_u, v)
-print(f"(v x u) . v = {dot_vcrossu_v}")
+if __name__ == "__main__":
+    # Define vectors u and v
+    u = np.array([1, 2, 3])
+    v = np.array([4, 5, 6])
+
+    print(f"Vector u = {u}")
+    print(f"Vector v = {v}")
+    print("-" * 30)
+
+    # 1. Compute u x v
+    u_cross_v = crossprod(u, v)
+    print(f"u x v = {u_cross_v}")
+
+    # 2. Compute v x u
+    v_cross_u = crossprod(v, u)
+    print(f"v x u = {v_cross_u}")
+    print("(Note: v x u should be -(u x v))")
+    print("-" * 30)
+
+    # 3. Compute (u x v) . u
+    # The dot product of (u x v) with u should be 0, as u_cross_v is orthogonal to u.
+    dot_ucrossv_u = np.dot(u_cross_v, u)
+    print(f"(u x v) . u = {dot_ucrossv_u}")
+    print("-" * 30)
+
+    # 4. Compute (v x u) . v
+    # The dot product of (v x u) with v should be 0, as v_cross_u is orthogonal to v.
+    dot_vcrossu_v = np.dot(v_cross_u, v)
+    print(f"(v x u) . v = {dot_vcrossu_v}")
+    print("-" * 30)
+
+    # 5. Same check with the fused scalar triple product: u . (u x v) = 0
+    print(f"u . (u x v) = {triple_product(u, u, v)}")
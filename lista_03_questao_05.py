@@ -1,49 +1,287 @@
+from multiprocessing import Pool
+
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.linalg import eigvalsh_tridiagonal
+from scipy.linalg.lapack import dtbtrs
 
 def wilkinson_bidiagonal(n):
     A = np.diag(np.arange(n, 0, -1, dtype=float))  # força tipo float
     A += np.diag([n] * (n - 1), k=1)
     return A
 
-n_values = range(1, 16)
-cond_numbers = [np.linalg.cond(wilkinson_bidiagonal(n)) for n in n_values]
-
-plt.figure(figsize=(8, 5))
-plt.plot(n_values, cond_numbers, marker='o')
-plt.title("Número de condição da matriz bidiagonal de Wilkinson")
-plt.xlabel("Ordem n")
-plt.ylabel("Número de condição")
-plt.grid(True)
-plt.show()
-
-# Matriz original A(20)
-n = 20
-A = wilkinson_bidiagonal(n)
-
-# Autovalores da matriz original
-eigvals_original = np.linalg.eigvals(A)
-
-# Criar perturbação pequena
-np.random.seed(0)  # garante reprodutibilidade
-perturbation = 1e-10 * np.random.randn(n, n)
-A_perturbed = A + perturbation
-
-# Autovalores da matriz perturbada
-eigvals_perturbed = np.linalg.eigvals(A_perturbed)
-
-# Imprimir os autovalores
-print("Autovalores da matriz original:\n", np.sort(np.real(eigvals_original)))
-print("\nAutovalores da matriz perturbada:\n", np.sort(np.real(eigvals_perturbed)))
-
-# Gráfico comparativo
-plt.figure(figsize=(9, 5))
-plt.plot(np.sort(np.real(eigvals_original)), 'o-', label='Original')
-plt.plot(np.sort(np.real(eigvals_perturbed)), 'x--', label='Perturbada (1e-10)')
-plt.title("Autovalores da matriz bidiagonal de Wilkinson (n=20)")
-plt.xlabel("Índice ordenado")
-plt.ylabel("Autovalores (parte real)")
-plt.grid(True)
-plt.legend()
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+# Representacao em banda (O(n) memoria) da matriz bidiagonal superior
+class MatrizBidiagonal:
+    """
+    Matriz bidiagonal superior n x n guardada apenas pela diagonal (n,) e pela
+    superdiagonal (n-1,). Produtos e sistemas custam O(n); os numeros de
+    condicao nas normas 1 e 2 sao estimados com algumas solucoes de sistemas,
+    sem formar a matriz densa nem calcular SVD.
+    """
+
+    def __init__(self, diagonal, superdiagonal):
+        self.diagonal = np.asarray(diagonal, dtype=float)
+        self.superdiagonal = np.asarray(superdiagonal, dtype=float)
+        self.n = self.diagonal.shape[0]
+        if self.diagonal.ndim != 1 or self.superdiagonal.shape != (max(self.n - 1, 0),):
+            raise ValueError("A superdiagonal deve ter exatamente n - 1 elementos.")
+        self._banda = None
+
+    @classmethod
+    def wilkinson(cls, n):
+        # Mesma matriz de wilkinson_bidiagonal(n): diagonal n, ..., 1 e superdiagonal n
+        return cls(np.arange(n, 0, -1, dtype=float), np.full(n - 1, float(n)))
+
+    def densa(self):
+        A = np.diag(self.diagonal)
+        A += np.diag(self.superdiagonal, k=1)
+        return A
+
+    def matvec(self, x):
+        # y = A x
+        y = self.diagonal * x
+        y[:-1] += self.superdiagonal * x[1:]
+        return y
+
+    def rmatvec(self, x):
+        # y = A^T x
+        y = self.diagonal * x
+        y[1:] += self.superdiagonal * x[:-1]
+        return y
+
+    def resolver(self, b, transposta=False):
+        # Resolve A x = b (ou A^T x = b) em O(n): sistema triangular em banda (LAPACK dtbtrs)
+        if self._banda is None:
+            self._banda = np.zeros((2, self.n))
+            self._banda[0, 1:] = self.superdiagonal
+            self._banda[1] = self.diagonal
+        x, info = dtbtrs(self._banda, b, uplo='U', trans='T' if transposta else 'N')
+        if info > 0:
+            raise np.linalg.LinAlgError(f"Elemento nulo na diagonal na posicao {info}.")
+        return x
+
+    def norma1(self):
+        # Maior soma de coluna: |d_j| + |s_(j-1)|
+        colunas = np.abs(self.diagonal)
+        colunas[1:] += np.abs(self.superdiagonal)
+        return colunas.max()
+
+    def norma_inf(self):
+        # Maior soma de linha: |d_i| + |s_i|
+        linhas = np.abs(self.diagonal)
+        linhas[:-1] += np.abs(self.superdiagonal)
+        return linhas.max()
+
+    def norma1_inversa(self, iteracoes=5):
+        # Estimador de Hager (base do xLACON do LAPACK) para ||A^-1||_1,
+        # com duas solucoes de sistema (O(n)) por iteracao
+        x = np.full(self.n, 1.0 / self.n)
+        estimativa = 0.0
+        with np.errstate(over='ignore', invalid='ignore'):
+            for k in range(iteracoes):
+                y = self.resolver(x)
+                nova = np.abs(y).sum()
+                if not np.isfinite(nova):
+                    return np.inf  # A^-1 nao cabe em ponto flutuante
+                if k > 0 and nova <= estimativa:
+                    break
+                estimativa = nova
+                sinais = np.where(y >= 0, 1.0, -1.0)
+                z = self.resolver(sinais, transposta=True)
+                j = np.argmax(np.abs(z))
+                if k > 0 and np.abs(z[j]) <= z @ x:
+                    break
+                x = np.zeros(self.n)
+                x[j] = 1.0
+        return estimativa
+
+    def cond1(self, iteracoes=5):
+        return self.norma1() * self.norma1_inversa(iteracoes)
+
+    def cond2(self, passos=30, semente=0):
+        # sigma_max^2 e 1 / sigma_min^2 como o maior valor de Ritz de 'passos' passos de
+        # Lanczos (sem reortogonalizacao, O(n) memoria) em A^T A e em (A^T A)^-1; cada
+        # passo custa um produto ou duas solucoes bidiagonais, O(n), e o total e
+        # O(passos * n) independentemente do espectro (nao itera ate convergir).
+        # Os valores de Ritz nunca excedem os autovalores, logo o resultado e uma
+        # estimativa por baixo de cond_2(A); com inicio aleatorio, o erro relativo de
+        # cada autovalor e tipicamente da ordem de (ln n / passos)^2 (limite de
+        # Kuczynski-Wozniakowski), ou seja, alguns porcento para n = 10^6 e 30 passos.
+        if self.n <= 2:
+            return np.linalg.cond(self.densa())
+        x0 = np.random.default_rng(semente).standard_normal(self.n)
+
+        def ata_inversa(x):
+            return self.resolver(self.resolver(x, transposta=True))
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            if not np.all(np.isfinite(ata_inversa(np.ones(self.n)))):
+                return np.inf  # A^-1 nao cabe em ponto flutuante
+            lambda_inversa = _maior_valor_ritz(ata_inversa, x0, passos)
+
+        lambda_max = _maior_valor_ritz(lambda x: self.rmatvec(self.matvec(x)), x0, passos)
+        return np.sqrt(lambda_max * lambda_inversa)
+
+def _maior_valor_ritz(operador, x0, passos):
+    # Maior autovalor da tridiagonal de Lanczos com 'passos' passos para o operador
+    # simetrico positivo semidefinido (tres vetores de trabalho)
+    alfas, betas = [], []
+    q_anterior = np.zeros_like(x0)
+    q = x0 / np.linalg.norm(x0)
+    beta = 0.0
+    for _ in range(min(passos, x0.shape[0])):
+        w = operador(q)
+        alfa = q @ w
+        w -= alfa * q
+        w -= beta * q_anterior
+        alfas.append(alfa)
+        escala = np.abs(w).max()  # norma escalada: w pode ter entradas ~1e165 ((A^T A)^-1)
+        if not np.isfinite(escala):
+            return np.inf  # o operador transborda o ponto flutuante
+        beta = escala * np.linalg.norm(w / escala) if escala > 0 else 0.0
+        if beta <= np.finfo(float).eps * abs(alfa):
+            break  # subespaco de Krylov invariante: os valores de Ritz sao exatos
+        betas.append(beta)
+        q_anterior, q = q, w / beta
+    # T e escalada para ordem 1 antes do LAPACK (stebz falha com entradas ~1e170)
+    escala = np.abs(alfas).max()
+    if escala == 0:
+        return 0.0
+    k = len(alfas)
+    return escala * eigvalsh_tridiagonal(np.array(alfas) / escala, np.array(betas[:k - 1]) / escala,
+                                         select='i', select_range=(k - 1, k - 1))[0]
+
+# Experimento de perturbacao de Monte Carlo (pseudoespectro)
+def _autovalores_perturbados(argumentos):
+    # Executado no processo trabalhador: um lote de autovalores de A + magnitude * E,
+    # com E gaussiana e semente derivada de (semente, indice da magnitude, indice do lote)
+    n, magnitude, tamanho, semente, i_magnitude, i_lote = argumentos
+    rng = np.random.default_rng(np.random.SeedSequence([semente, i_magnitude, i_lote]))
+    perturbadas = rng.standard_normal((tamanho, n, n))
+    perturbadas *= magnitude
+    perturbadas += wilkinson_bidiagonal(n)
+    return i_magnitude, i_lote, np.linalg.eigvals(perturbadas)
+
+def perturbacao_monte_carlo(n, magnitudes, amostras, arquivo_saida, tamanho_lote=100,
+                            processos=None, semente=0, grade=None):
+    """
+    Amostra 'amostras' perturbacoes gaussianas A + magnitude * E da matriz de
+    Wilkinson A(n) para cada magnitude, calculando os autovalores em lotes num
+    pool de processos (processos=1 executa no proprio processo).
+
+    As nuvens de autovalores sao gravadas em arquivo_saida (.npy, memmap de forma
+    (magnitudes, amostras, n), complexo) a medida que cada lote chega, e as
+    estatisticas sao acumuladas sem manter as amostras em memoria:
+      - desvio_max_*: media, desvio padrao e maximo, por magnitude, do maior
+        |lambda_perturbado - lambda_original| de cada amostra (autovalores
+        pareados pela ordem da parte real);
+      - desvio_medio_por_autovalor: media de |lambda_perturbado - lambda_original|
+        para cada autovalor original 1, ..., n;
+      - contagens: histograma 2D dos autovalores numa grade do plano complexo,
+        uma estimativa do pseudoespectro de cada magnitude.
+    grade = (re_min, re_max, im_min, im_max, resolucao); por padrao cobre
+    [0, n + 1] x [-(n + 1)/2, (n + 1)/2] com 200 x 200 celulas.
+
+    Retorna um dicionario com as estatisticas e os limites da grade.
+    """
+    magnitudes = np.atleast_1d(np.asarray(magnitudes, dtype=float))
+    if grade is None:
+        grade = (0.0, n + 1.0, -(n + 1.0) / 2, (n + 1.0) / 2, 200)
+    re_min, re_max, im_min, im_max, resolucao = grade
+    bordas_re = np.linspace(re_min, re_max, resolucao + 1)
+    bordas_im = np.linspace(im_min, im_max, resolucao + 1)
+
+    # A e triangular: seus autovalores sao a diagonal n, ..., 1 (aqui em ordem crescente)
+    originais = np.arange(1, n + 1, dtype=float)
+
+    nuvens = np.lib.format.open_memmap(arquivo_saida, mode='w+', dtype=complex,
+                                       shape=(magnitudes.size, amostras, n))
+    soma = np.zeros(magnitudes.size)
+    soma_quadrados = np.zeros(magnitudes.size)
+    maximo = np.zeros(magnitudes.size)
+    soma_por_autovalor = np.zeros((magnitudes.size, n))
+    contagens = np.zeros((magnitudes.size, resolucao, resolucao), dtype=np.int64)
+
+    tarefas = [(n, magnitude, min(tamanho_lote, amostras - inicio), semente, i, inicio // tamanho_lote)
+               for i, magnitude in enumerate(magnitudes)
+               for inicio in range(0, amostras, tamanho_lote)]
+
+    pool = None if processos == 1 else Pool(processos)
+    resultados = map(_autovalores_perturbados, tarefas) if pool is None else \
+        pool.imap_unordered(_autovalores_perturbados, tarefas)
+    try:
+        for i, i_lote, autovalores in resultados:
+            inicio = i_lote * tamanho_lote
+            nuvens[i, inicio:inicio + autovalores.shape[0]] = autovalores
+
+            # Pareia pela ordem da parte real e acumula os desvios
+            ordem = np.argsort(autovalores.real, axis=1)
+            desvios = np.abs(np.take_along_axis(autovalores, ordem, axis=1) - originais)
+            desvio_max = desvios.max(axis=1)
+            soma[i] += desvio_max.sum()
+            soma_quadrados[i] += (desvio_max ** 2).sum()
+            maximo[i] = max(maximo[i], desvio_max.max())
+            soma_por_autovalor[i] += desvios.sum(axis=0)
+
+            contagens[i] += np.histogram2d(autovalores.real.ravel(), autovalores.imag.ravel(),
+                                           bins=(bordas_re, bordas_im))[0].astype(np.int64)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        nuvens.flush()
+
+    media = soma / amostras
+    return {
+        "magnitudes": magnitudes,
+        "desvio_max_media": media,
+        "desvio_max_desvio_padrao": np.sqrt(np.maximum(soma_quadrados / amostras - media ** 2, 0.0)),
+        "desvio_max_maximo": maximo,
+        "desvio_medio_por_autovalor": soma_por_autovalor / amostras,
+        "contagens": contagens,
+        "bordas_re": bordas_re,
+        "bordas_im": bordas_im,
+    }
+
+if __name__ == "__main__":
+    n_values = range(1, 16)
+    cond_numbers = [np.linalg.cond(wilkinson_bidiagonal(n)) for n in n_values]
+
+    plt.figure(figsize=(8, 5))
+    plt.plot(n_values, cond_numbers, marker='o')
+    plt.title("Número de condição da matriz bidiagonal de Wilkinson")
+    plt.xlabel("Ordem n")
+    plt.ylabel("Número de condição")
+    plt.grid(True)
+    plt.show()
+
+    # Matriz original A(20)
+    n = 20
+    A = wilkinson_bidiagonal(n)
+
+    # Autovalores da matriz original
+    eigvals_original = np.linalg.eigvals(A)
+
+    # Criar perturbação pequena
+    np.random.seed(0)  # garante reprodutibilidade
+    perturbation = 1e-10 * np.random.randn(n, n)
+    A_perturbed = A + perturbation
+
+    # Autovalores da matriz perturbada
+    eigvals_perturbed = np.linalg.eigvals(A_perturbed)
+
+    # Imprimir os autovalores
+    print("Autovalores da matriz original:\n", np.sort(np.real(eigvals_original)))
+    print("\nAutovalores da matriz perturbada:\n", np.sort(np.real(eigvals_perturbed)))
+
+    # Gráfico comparativo
+    plt.figure(figsize=(9, 5))
+    plt.plot(np.sort(np.real(eigvals_original)), 'o-', label='Original')
+    plt.plot(np.sort(np.real(eigvals_perturbed)), 'x--', label='Perturbada (1e-10)')
+    plt.title("Autovalores da matriz bidiagonal de Wilkinson (n=20)")
+    plt.xlabel("Índice ordenado")
+    plt.ylabel("Autovalores (parte real)")
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
\ No newline at end of file
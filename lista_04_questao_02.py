@@ -1,3 +1,5 @@
+import time
+
 import numpy as np
 import scipy.linalg
 
@@ -24,6 +26,225 @@ def lu_decomp_partial_pivoting(A):
     U = np.triu(A)
     return L, U, P
 
+def lu_compacta(A, sobrescrever=False):
+    """
+    Decomposicao LU com pivotamento parcial em armazenamento compacto.
+    L (sem a diagonal unitaria) e U ficam no mesmo array, e as trocas de linha
+    sao guardadas num vetor de permutacao: PA = LU com P = np.eye(m)[piv].
+    Cada passo faz uma unica atualizacao vetorizada de posto um.
+    A pode ser retangular (m x n). Se sobrescrever=True e A ja for um array de
+    ponto flutuante, a fatoracao e feita no proprio A; caso contrario, numa copia
+    (o tipo float32/float64 de A e preservado).
+    Retorna LU, piv.
+    """
+    if sobrescrever and isinstance(A, np.ndarray) and A.dtype.kind == 'f':
+        LU = A
+    else:
+        A = np.asarray(A)
+        LU = np.array(A, dtype=A.dtype if A.dtype.kind == 'f' else float)
+    m, n = LU.shape
+    piv = np.arange(m)
+
+    for i in range(min(m, n)):
+        pivot_index = np.argmax(np.abs(LU[i:, i])) + i
+        if pivot_index != i:
+            LU[[i, pivot_index]] = LU[[pivot_index, i]]
+            piv[[i, pivot_index]] = piv[[pivot_index, i]]
+        if LU[i, i] != 0:  # coluna nula: nada a eliminar (como no LAPACK)
+            LU[i+1:, i] /= LU[i, i]
+            LU[i+1:, i+1:] -= LU[i+1:, i, np.newaxis] * LU[np.newaxis, i, i+1:]
+    return LU, piv
+
+def expandir_L(LU):
+    """L (m x k, diagonal unitaria) a partir do armazenamento compacto."""
+    k = min(LU.shape)
+    return np.tril(LU[:, :k], -1) + np.eye(LU.shape[0], k, dtype=LU.dtype)
+
+def expandir_U(LU):
+    """U (k x n, triangular superior) a partir do armazenamento compacto."""
+    return np.triu(LU[:min(LU.shape)])
+
+def expandir_P(piv):
+    """Matriz de permutacao P tal que PA = LU."""
+    return np.eye(len(piv))[piv]
+
+class FatoracaoLU:
+    """
+    Fatoracao LU em blocos (PA = LU), feita uma vez e reutilizada em varias solucoes.
+
+    Algoritmo right-looking em blocos de 'tamanho_bloco' colunas: cada painel
+    A[k0:, k0:k1] e fatorado por lu_compacta, as trocas de linha sao aplicadas
+    ao restante da matriz, o bloco U12 sai de uma solucao triangular e o bloco
+    restante recebe a atualizacao de nivel 3 A22 -= L21 @ U12 (produto de matrizes).
+
+    dtype define a precisao da fatoracao (float64 por padrao; float32 usa metade
+    da memoria). Os fatores ficam compactos em self.LU e a permutacao em self.piv.
+    """
+
+    def __init__(self, A, tamanho_bloco=64, sobrescrever=False, dtype=None):
+        A = np.asarray(A)
+        if dtype is None:
+            dtype = A.dtype if A.dtype.kind == 'f' else np.float64
+        if sobrescrever and A.dtype == dtype:
+            LU = A
+        else:
+            LU = np.array(A, dtype=dtype)
+        if LU.ndim != 2 or LU.shape[0] != LU.shape[1]:
+            raise ValueError("A deve ser uma matriz quadrada.")
+
+        n = LU.shape[0]
+        piv = np.arange(n)
+
+        for k0 in range(0, n, tamanho_bloco):
+            k1 = min(k0 + tamanho_bloco, n)
+
+            # Fatoracao do painel (in-place, sobre a visao LU[k0:, k0:k1])
+            _, piv_painel = lu_compacta(LU[k0:, k0:k1], sobrescrever=True)
+
+            # Aplica as trocas do painel as demais colunas, apenas nas linhas que mudaram
+            movidas = np.flatnonzero(piv_painel != np.arange(n - k0))
+            if movidas.size:
+                origem = k0 + piv_painel[movidas]
+                destino = k0 + movidas
+                LU[destino, :k0] = LU[origem, :k0]
+                LU[destino, k1:] = LU[origem, k1:]
+                piv[destino] = piv[origem]
+
+            if k1 < n:
+                # U12 = L11^-1 A12  e  A22 -= L21 @ U12
+                LU[k0:k1, k1:] = scipy.linalg.solve_triangular(
+                    LU[k0:k1, k0:k1], LU[k0:k1, k1:], lower=True, unit_diagonal=True,
+                    check_finite=False)
+                LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+
+        self.LU = LU
+        self.piv = piv
+        self.n = n
+
+    def solve(self, B):
+        """
+        Resolve A X = B reutilizando os fatores (B com forma (n,) ou (n, k)).
+        B e convertido para a precisao da fatoracao.
+        """
+        B = np.asarray(B, dtype=self.LU.dtype)
+        if B.shape[0] != self.n:
+            raise ValueError("B deve ter n linhas.")
+        Y = scipy.linalg.solve_triangular(self.LU, B[self.piv], lower=True, unit_diagonal=True,
+                                          check_finite=False)
+        return scipy.linalg.solve_triangular(self.LU, Y, lower=False, check_finite=False)
+
+    def _sinal_permutacao(self):
+        # Paridade da permutacao: (n - numero de ciclos) trocas
+        visitado = np.zeros(self.n, dtype=bool)
+        ciclos = 0
+        for inicio in range(self.n):
+            if not visitado[inicio]:
+                ciclos += 1
+                j = inicio
+                while not visitado[j]:
+                    visitado[j] = True
+                    j = self.piv[j]
+        return -1.0 if (self.n - ciclos) % 2 else 1.0
+
+    def det(self):
+        """Determinante de A: sinal(P) * prod(diag(U))."""
+        return self._sinal_permutacao() * np.prod(np.diagonal(self.LU), dtype=np.float64)
+
+    def logdet(self):
+        """Retorna (sinal, log|det(A)|), sem overflow para n grande (como np.linalg.slogdet)."""
+        diagonal = np.diagonal(self.LU).astype(np.float64)
+        if np.any(diagonal == 0):
+            return 0.0, -np.inf
+        sinal = self._sinal_permutacao() * np.prod(np.sign(diagonal))
+        return sinal, np.sum(np.log(np.abs(diagonal)))
+
+def resolver_precisao_mista(A, b, tol=None, max_iter=30, tamanho_bloco=64):
+    """
+    Resolve A x = b fatorando A em float32 (FatoracaoLU, pivotamento parcial) e
+    recuperando a precisao de float64 por refinamento iterativo: a cada passo o
+    residuo r = b - A x e calculado em float64 e a correcao A d = r e resolvida
+    com os fatores float32.
+
+    O refinamento para quando o erro relativo ||r||_inf / (||A||_inf ||x||_inf)
+    fica abaixo de tol (padrao sqrt(n) * eps(float64), o criterio do dsgesv do
+    LAPACK). Se o erro deixar de cair pela metade a cada passo, ficar nao finito
+    ou max_iter for atingido (caso de matrizes mal condicionadas, como a
+    bidiagonal de Wilkinson), A e refatorada em float64 automaticamente; o mesmo
+    acontece se A for singular em float32 (LinAlgError na fatoracao ou solucao).
+
+    Retorna x e um dicionario com 'precisao' ("float32" ou "float64"),
+    'iteracoes' de refinamento, o 'erro_relativo' final e 'singular_float32'
+    (True se o recurso a float64 foi causado por A singular em float32).
+    """
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    n = A.shape[0]
+    if tol is None:
+        tol = np.sqrt(n) * np.finfo(np.float64).eps
+    norma_A = np.linalg.norm(A, np.inf)
+
+    def erro_relativo(x, r):
+        norma_x = np.abs(x).max()
+        if norma_A == 0 or norma_x == 0:
+            return 0.0 if not np.abs(r).max() else np.inf
+        return np.abs(r).max() / (norma_A * norma_x)
+
+    iteracao = 0
+    singular_float32 = False
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        try:
+            fatoracao = FatoracaoLU(A, tamanho_bloco=tamanho_bloco, dtype=np.float32)
+            x = fatoracao.solve(b).astype(np.float64)
+            erro_anterior = np.inf
+            for iteracao in range(max_iter + 1):
+                r = b - A @ x
+                erro = erro_relativo(x, r)
+                if erro <= tol:
+                    return x, {"precisao": "float32", "iteracoes": iteracao, "erro_relativo": erro,
+                               "singular_float32": False}
+                if not np.isfinite(erro) or erro > 0.5 * erro_anterior:
+                    break  # refinamento estagnou ou divergiu
+                erro_anterior = erro
+                x += fatoracao.solve(r)
+        except np.linalg.LinAlgError:
+            singular_float32 = True  # A singular em float32 (pode nao ser em float64)
+
+    # Recurso: fatoracao completa em float64
+    x = FatoracaoLU(A, tamanho_bloco=tamanho_bloco, dtype=np.float64).solve(b)
+    return x, {"precisao": "float64", "iteracoes": iteracao, "erro_relativo": erro_relativo(x, b - A @ x),
+               "singular_float32": singular_float32}
+
+def comparar_com_scipy(n=2000, num_rhs=100, tamanho_bloco=64, semente=0):
+    """
+    Mede o tempo (em segundos) da fatoracao e da solucao com num_rhs lados direitos
+    de FatoracaoLU contra scipy.linalg.lu (referencia usada neste script) e
+    scipy.linalg.lu_factor/lu_solve, numa matriz aleatoria n x n.
+    """
+    rng = np.random.default_rng(semente)
+    A = rng.standard_normal((n, n))
+    B = rng.standard_normal((n, num_rhs))
+    tempos = {}
+
+    inicio = time.perf_counter()
+    fatoracao = FatoracaoLU(A, tamanho_bloco=tamanho_bloco)
+    tempos["FatoracaoLU"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    X = fatoracao.solve(B)
+    tempos["FatoracaoLU.solve"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    scipy.linalg.lu(A)
+    tempos["scipy.linalg.lu"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    fatores_scipy = scipy.linalg.lu_factor(A)
+    tempos["scipy.linalg.lu_factor"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    scipy.linalg.lu_solve(fatores_scipy, B)
+    tempos["scipy.linalg.lu_solve"] = time.perf_counter() - inicio
+
+    tempos["residuo_relativo"] = np.linalg.norm(A @ X - B) / (np.linalg.norm(A) * np.linalg.norm(X))
+    return tempos
+
 # === MATRIZ 3x3 ===
 A1 = np.array([
     [2, 3, 1],
@@ -66,5 +287,11 @@ def mostrar_resultados(A, nome):
 
 
 # Mostrar os resultados para ambas as matrizes
-mostrar_resultados(A1, "Matriz 3x3")
-mostrar_resultados(A2, "Matriz 4x4")
\ No newline at end of file
+if __name__ == "__main__":
+    mostrar_resultados(A1, "Matriz 3x3")
+    mostrar_resultados(A2, "Matriz 4x4")
+
+    # Fatoracao em blocos reutilizada, comparada com o SciPy
+    print("\n" + "="*10 + " FatoracaoLU x SciPy (n = 1000) " + "="*10)
+    for nome, valor in comparar_com_scipy(n=1000).items():
+        print(f"{nome}: {valor:.3e}")
@@ -1,4 +1,9 @@
+import mmap
+import os
+from multiprocessing import Pool
+
 import numpy as np
+from scipy.linalg import solve_triangular
 
 def modified_gram_schmidt(A):
     """
@@ -33,6 +38,299 @@ def modified_gram_schmidt(A):
 
     return Q, R
 
+def bcgs2(A, tamanho_bloco=32, sobrescrever=False):
+    """
+    Decomposicao QR por Gram-Schmidt classico em blocos com reortogonalizacao (BCGS2).
+
+    As colunas sao processadas em paineis de 'tamanho_bloco': cada painel W e
+    projetado contra as colunas ja ortonormalizadas Q com produtos de matrizes
+    (S = Q.T @ W; W -= Q @ S), e ortonormalizado internamente por QR de
+    Householder. A projecao e repetida uma segunda vez (reortogonalizacao),
+    o que mantem ||I - Q.T Q|| da ordem do epsilon da maquina.
+
+    Parametros:
+    A : numpy.ndarray (m x n)
+        Matriz de entrada (com m linhas e n colunas)
+    tamanho_bloco : int
+        Numero de colunas por painel
+    sobrescrever : bool
+        Se True e A for um array de ponto flutuante, A e sobrescrita por Q
+        (modo economico, sem alocar outra matriz m x n)
+
+    Retorna:
+    Q : numpy.ndarray (m x n)
+        Matriz com colunas ortonormais
+    R : numpy.ndarray (n x n)
+        Matriz triangular superior (diagonal positiva, como em modified_gram_schmidt)
+    """
+    if sobrescrever and isinstance(A, np.ndarray) and A.dtype.kind == 'f':
+        Q = A
+    else:
+        Q = np.array(A, dtype=float)
+    m, n = Q.shape
+    R = np.zeros((n, n), dtype=Q.dtype)
+
+    def qr_painel(W):
+        # QR de Householder do painel, com a diagonal de R positiva; Q sobrescreve W
+        Qw, Rw = np.linalg.qr(W)
+        sinais = np.where(np.diagonal(Rw) < 0, -1.0, 1.0)
+        W[:] = Qw * sinais
+        return Rw * sinais[:, np.newaxis]
+
+    for k0 in range(0, n, tamanho_bloco):
+        k1 = min(k0 + tamanho_bloco, n)
+        W = Q[:, k0:k1]
+        anteriores = Q[:, :k0]
+
+        if k0 == 0:
+            R[:k1, :k1] = qr_painel(W)
+            continue
+
+        # Primeira passagem
+        S1 = anteriores.T @ W
+        W -= anteriores @ S1
+        R1 = qr_painel(W)
+
+        # Segunda passagem (reortogonalizacao)
+        S2 = anteriores.T @ W
+        W -= anteriores @ S2
+        R2 = qr_painel(W)
+
+        R[:k0, k0:k1] = S1 + S2 @ R1
+        R[k0:k1, k0:k1] = R2 @ R1
+
+    return Q, R
+
+def perda_ortogonalidade(Q):
+    """
+    Perda de ortogonalidade ||I - Q.T @ Q||_F das colunas de Q.
+    """
+    return np.linalg.norm(np.eye(Q.shape[1]) - Q.T @ Q)
+
+def _fonte_do_bloco(origem, inicio, fim):
+    """
+    Descricao das linhas [inicio, fim) da origem, leve o bastante para ser enviada
+    a um trabalhador: o caminho do .npy, os parametros de um memmap (reaberto pelo
+    trabalhador) ou, para outros arrays, apenas a fatia do bloco. Enviar a origem
+    inteira faria o pickle copiar a matriz m x n para cada tarefa.
+    """
+    if isinstance(origem, (str, bytes, os.PathLike)):
+        return origem, inicio, fim
+    if (isinstance(origem, np.memmap) and isinstance(origem.base, mmap.mmap)
+            and origem.flags.c_contiguous):
+        return ('memmap', origem.filename, origem.offset, origem.dtype, origem.shape), inicio, fim
+    return np.asarray(origem[inicio:fim]), 0, fim - inicio
+
+def _ler_bloco_linhas(fonte):
+    """Le as linhas descritas por _fonte_do_bloco (via memmap, para arquivos)."""
+    origem, inicio, fim = fonte
+    if isinstance(origem, (str, bytes, os.PathLike)):
+        origem = np.load(origem, mmap_mode='r')
+    elif isinstance(origem, tuple):
+        _, arquivo, deslocamento, dtype, forma = origem
+        origem = np.memmap(arquivo, dtype=dtype, mode='r', offset=deslocamento, shape=forma)
+    return np.array(origem[inicio:fim], dtype=float)
+
+def _r_do_bloco(fonte):
+    # Executado no processo trabalhador: fator R do bloco de linhas
+    return np.linalg.qr(_ler_bloco_linhas(fonte), mode='r')
+
+def _q_do_bloco(fonte, coeficiente):
+    # Q do bloco (recalculado, mesma fatoracao que gerou o R da folha) vezes o coeficiente da arvore
+    return np.linalg.qr(_ler_bloco_linhas(fonte))[0] @ coeficiente
+
+def _gravar_q_do_bloco(argumentos):
+    # Executado no processo trabalhador: grava as linhas [inicio, fim) de Q no arquivo de saida
+    fonte, inicio, fim, coeficiente, caminho_q = argumentos
+    Q = np.load(caminho_q, mmap_mode='r+')
+    Q[inicio:fim] = _q_do_bloco(fonte, coeficiente)
+    Q.flush()
+    return inicio
+
+def _mapear(funcao, tarefas, processos):
+    """map em um pool de processos (ou no proprio processo, se processos=1), preservando a ordem."""
+    if processos == 1:
+        return list(map(funcao, tarefas))
+    with Pool(processos) as pool:
+        return pool.map(funcao, tarefas)
+
+class TSQR:
+    """
+    Decomposicao QR de matrizes altas e finas (m >> n) por blocos de linhas (TSQR).
+
+    As linhas sao divididas em blocos de 'tamanho_bloco'; cada bloco e fatorado
+    (A_i = Q_i R_i) em um processo trabalhador, e os fatores R_i, pequenos (n x n),
+    sao combinados numa arvore de reducao binaria: cada no fatora [R_a; R_b].
+    Cada trabalhador so mantem um bloco em memoria, O(tamanho_bloco x n), e cada
+    tarefa so transporta o seu bloco (ou o caminho/memmap de onde le-lo).
+
+    A origem pode ser o caminho de um arquivo .npy (aberto como memmap por cada
+    trabalhador, o caso indicado para matrizes maiores que a RAM) ou um array.
+
+    Q nao e formada: fica implicita como Q = diag(Q_1, ..., Q_p) @ C, com um
+    coeficiente C_i (n x n) por bloco vindo da arvore. bloco_q(i) calcula as
+    linhas de Q de um bloco e gravar_q grava Q em disco bloco a bloco.
+    """
+
+    def __init__(self, origem, tamanho_bloco=100000, processos=None):
+        self.origem = origem
+        forma = (np.load(origem, mmap_mode='r') if isinstance(origem, (str, bytes, os.PathLike))
+                 else origem).shape
+        if len(forma) != 2:
+            raise ValueError("A matriz de entrada deve ser bidimensional.")
+        self.m, self.n = forma
+        self.processos = processos
+        self.blocos = [(inicio, min(inicio + tamanho_bloco, self.m))
+                       for inicio in range(0, self.m, tamanho_bloco)]
+
+        folhas = _mapear(_r_do_bloco, [_fonte_do_bloco(origem, inicio, fim)
+                                       for inicio, fim in self.blocos], processos)
+        R, coeficientes = self._reduzir(folhas)
+
+        # Diagonal de R positiva, como em modified_gram_schmidt
+        sinais = np.where(np.diagonal(R) < 0, -1.0, 1.0)
+        self.R = R * sinais[:, np.newaxis]
+        self.coeficientes = [C * sinais for C in coeficientes]
+
+    @staticmethod
+    def _reduzir(fatores):
+        # Arvore binaria: retorna R da raiz e, para cada folha i, C_i tal que
+        # o bloco i de Q e Q_i @ C_i
+        if len(fatores) == 1:
+            return fatores[0], [np.eye(fatores[0].shape[0])]
+        meio = len(fatores) // 2
+        Ra, Ca = TSQR._reduzir(fatores[:meio])
+        Rb, Cb = TSQR._reduzir(fatores[meio:])
+        Q, R = np.linalg.qr(np.vstack([Ra, Rb]))
+        ka = Ra.shape[0]
+        return R, [C @ Q[:ka] for C in Ca] + [C @ Q[ka:] for C in Cb]
+
+    def bloco_q(self, i):
+        """Linhas de Q correspondentes ao bloco i (Q implicita, calculada sob demanda)."""
+        inicio, fim = self.blocos[i]
+        return _q_do_bloco(_fonte_do_bloco(self.origem, inicio, fim), self.coeficientes[i])
+
+    def gravar_q(self, caminho_q):
+        """Grava Q (m x k) em um arquivo .npy, bloco a bloco, pelos processos trabalhadores."""
+        Q = np.lib.format.open_memmap(caminho_q, mode='w+', dtype=float, shape=(self.m, self.R.shape[0]))
+        del Q  # cada trabalhador reabre o arquivo e grava apenas o seu bloco
+        tarefas = [(_fonte_do_bloco(self.origem, inicio, fim), inicio, fim, C, caminho_q)
+                   for (inicio, fim), C in zip(self.blocos, self.coeficientes)]
+        _mapear(_gravar_q_do_bloco, tarefas, self.processos)
+        return np.load(caminho_q, mmap_mode='r')
+
+class QRAtualizavel:
+    """
+    Decomposicao QR economica (A = Q R, Q m x n, R n x n) atualizada a cada nova
+    coluna ou linha, sem refazer o Gram-Schmidt do zero (O(m n^2)).
+
+    Parte da saida de modified_gram_schmidt (ou de bcgs2) e suporta:
+      - adicionar_coluna: Gram-Schmidt classico com reortogonalizacao, O(m n);
+      - remover_coluna: rotacoes de Givens que devolvem R a forma triangular, O(m n);
+      - adicionar_linhas: rotacoes de Givens por linha nova, O(m n) por linha;
+      - resolver_minimos_quadrados: min ||A x - b||_2 com os fatores atuais.
+    """
+
+    def __init__(self, Q, R):
+        self.Q = np.array(Q, dtype=float)
+        self.R = np.array(R, dtype=float)
+        if self.Q.ndim != 2 or self.R.shape != (self.Q.shape[1], self.Q.shape[1]):
+            raise ValueError("Q deve ser m x n e R deve ser n x n.")
+
+    @classmethod
+    def de_matriz(cls, A):
+        """Cria a decomposicao a partir de A, com modified_gram_schmidt."""
+        return cls(*modified_gram_schmidt(np.asarray(A, dtype=float)))
+
+    @property
+    def shape(self):
+        return self.Q.shape
+
+    def adicionar_coluna(self, a):
+        """Acrescenta a coluna a (m,) ao final de A."""
+        a = np.asarray(a, dtype=float)
+        if a.shape != (self.Q.shape[0],):
+            raise ValueError("A coluna deve ter m elementos.")
+
+        # Duas passagens de Gram-Schmidt classico (CGS2)
+        r = self.Q.T @ a
+        w = a - self.Q @ r
+        correcao = self.Q.T @ w
+        w -= self.Q @ correcao
+        r += correcao
+
+        rho = np.linalg.norm(w)
+        if rho <= 10 * np.finfo(float).eps * np.linalg.norm(a):
+            raise ValueError("A nova coluna e linearmente dependente das colunas atuais.")
+
+        n = self.R.shape[0]
+        R = np.zeros((n + 1, n + 1))
+        R[:n, :n] = self.R
+        R[:n, n] = r
+        R[n, n] = rho
+        self.R = R
+        self.Q = np.column_stack([self.Q, w / rho])
+
+    def remover_coluna(self, j):
+        """Remove a coluna j de A."""
+        n = self.R.shape[0]
+        if not 0 <= j < n:
+            raise IndexError(f"Coluna {j} fora do intervalo [0, {n}).")
+
+        # Sem a coluna j, R fica de Hessenberg a partir de j: zera a subdiagonal com Givens
+        R = np.delete(self.R, j, axis=1)
+        Q = self.Q
+        for k in range(j, n - 1):
+            a, b = R[k, k], R[k + 1, k]
+            raio = np.hypot(a, b)
+            if raio == 0:
+                continue
+            c, s = a / raio, b / raio
+            linha_k = R[k, k:].copy()
+            R[k, k:] = c * linha_k + s * R[k + 1, k:]
+            R[k + 1, k:] = -s * linha_k + c * R[k + 1, k:]
+            coluna_k = Q[:, k].copy()
+            Q[:, k] = c * coluna_k + s * Q[:, k + 1]
+            Q[:, k + 1] = -s * coluna_k + c * Q[:, k + 1]
+            R[k + 1, k] = 0.0
+
+        self.R = np.ascontiguousarray(R[:n - 1])
+        self.Q = np.ascontiguousarray(Q[:, :n - 1])
+
+    def adicionar_linhas(self, X):
+        """Acrescenta as linhas de X ((k, n) ou (n,)) ao final de A."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        m, n = self.Q.shape
+        if X.shape[1] != n:
+            raise ValueError("As novas linhas devem ter n elementos.")
+
+        # [A; X] = [Q 0; 0 I] [R; X]: cada linha de X e anulada contra R com Givens,
+        # e as rotacoes sao aplicadas as colunas correspondentes de [Q 0; 0 I]
+        Q = np.vstack([self.Q, np.zeros((X.shape[0], n))])
+        R = self.R
+        for i, x in enumerate(X):
+            x = x.copy()
+            extra = np.zeros(Q.shape[0])
+            extra[m + i] = 1.0
+            for j in range(n):
+                if x[j] == 0:
+                    continue
+                raio = np.hypot(R[j, j], x[j])
+                c, s = R[j, j] / raio, x[j] / raio
+                linha_j = R[j, j:].copy()
+                R[j, j:] = c * linha_j + s * x[j:]
+                x[j:] = -s * linha_j + c * x[j:]
+                coluna_j = Q[:, j].copy()
+                Q[:, j] = c * coluna_j + s * extra
+                extra = -s * coluna_j + c * extra
+
+        self.Q = Q
+        self.R = R
+
+    def resolver_minimos_quadrados(self, b):
+        """Solucao de min ||A x - b||_2 (b com forma (m,) ou (m, k)): x = R^-1 Q.T b."""
+        return solve_triangular(self.R, self.Q.T @ np.asarray(b, dtype=float))
+
 # Matriz do Exercicio 14.15
 A = np.array([
     [1, 9, 0, 5, 3, 2],
@@ -43,18 +341,32 @@ A = np.array([
     [33, 7, 5, 3, 5, 7]
 ], dtype=float)
 
-Q, R = modified_gram_schmidt(A)
+if __name__ == "__main__":
+    Q, R = modified_gram_schmidt(A)
+
+    print("Q =\n", Q)
+    print("R =\n", R)
+    print("Reconstrucao A aproximadamente igual a Q @ R?\n", np.allclose(A, Q @ R))
+
+    # Decomposicao QR usando NumPy
+    Q, R = np.linalg.qr(A)
 
-print("Q =\n", Q)
-print("R =\n", R)
-print("Reconstrucao A aproximadamente igual a Q @ R?\n", np.allclose(A, Q @ R))
+    # Impressao dos resultados
+    print("Q (numpy.linalg.qr) =\n", Q)
+    print("\nR (numpy.linalg.qr) =\n", R)
 
-# Decomposicao QR usando NumPy
-Q, R = np.linalg.qr(A)
+    # Verificacao: A aproximadamente igual a QR?
+    print("\nReconstrucao A aproximadamente igual a Q @ R?\n", np.allclose(A, Q @ R))
 
-# Impressao dos resultados
-print("Q (numpy.linalg.qr) =\n", Q)
-print("\nR (numpy.linalg.qr) =\n", R)
+    # Gram-Schmidt em blocos com reortogonalizacao (BCGS2)
+    Q, R = bcgs2(A, tamanho_bloco=2)
+    print("\nReconstrucao A aproximadamente igual a Q @ R (BCGS2)?\n", np.allclose(A, Q @ R))
 
-# Verificacao: A aproximadamente igual a QR?
-print("\nReconstrucao A aproximadamente igual a Q @ R?\n", np.allclose(A, Q @ R))
\ No newline at end of file
+    # Perda de ortogonalidade numa matriz mal condicionada (cond ~ 1e10)
+    rng = np.random.default_rng(0)
+    U, _ = np.linalg.qr(rng.standard_normal((300, 60)))
+    V, _ = np.linalg.qr(rng.standard_normal((60, 60)))
+    B = U @ np.diag(np.logspace(0, -10, 60)) @ V.T
+    print("\nPerda de ortogonalidade ||I - Q.T Q||_F:")
+    print(" MGS   =", perda_ortogonalidade(modified_gram_schmidt(B)[0]))
+    print(" BCGS2 =", perda_ortogonalidade(bcgs2(B)[0]))